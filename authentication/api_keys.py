@@ -0,0 +1,84 @@
+"""
+API key verification.
+
+A key looks like ``<prefix>.<secret>``. Verification is one indexed lookup
+on the prefix and a constant-time compare of the secret's hash. Recently
+verified keys are kept in a small in-process LRU so repeat calls skip the
+database; entries expire after API_KEY_CACHE_TTL seconds so revocations in
+other processes take effect, and are dropped at once when the key changes
+in this process.
+"""
+import hmac
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .models import APIKey, hash_secret
+from .tokens import InvalidToken, TokenUser
+
+
+class VerifiedKeyCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, prefix):
+        with self._lock:
+            entry = self._entries.get(prefix)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._entries[prefix]
+                return None
+            self._entries.move_to_end(prefix)
+            return entry
+
+    def set(self, prefix, key_hash, user):
+        with self._lock:
+            self._entries[prefix] = (key_hash, time.monotonic() + settings.API_KEY_CACHE_TTL, user)
+            self._entries.move_to_end(prefix)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, prefix):
+        with self._lock:
+            self._entries.pop(prefix, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+verified_keys = VerifiedKeyCache(settings.API_KEY_CACHE_SIZE)
+
+
+def verify_api_key(raw_key):
+    """Return the ``TokenUser`` a valid key acts as; raise InvalidToken otherwise."""
+    prefix, _, secret = raw_key.partition('.')
+    if not prefix or not secret:
+        raise InvalidToken('Invalid API key.')
+    key_hash = hash_secret(secret)
+
+    entry = verified_keys.get(prefix)
+    if entry is not None:
+        if hmac.compare_digest(entry[0], key_hash):
+            return entry[2]
+        raise InvalidToken('Invalid API key.')
+
+    api_key = APIKey.objects.select_related('user').filter(
+        prefix=prefix, is_active=True, user__is_active=True,
+    ).first()
+    if api_key is None or not hmac.compare_digest(api_key.key_hash, key_hash):
+        raise InvalidToken('Invalid API key.')
+
+    user = TokenUser({
+        'uid': api_key.user.pk,
+        'usr': api_key.user.get_username(),
+        'stf': api_key.user.is_staff,
+        'su': api_key.user.is_superuser,
+    })
+    verified_keys.set(prefix, api_key.key_hash, user)
+    return user
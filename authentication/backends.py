@@ -0,0 +1,54 @@
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+from .api_keys import verify_api_key
+from .tokens import InvalidToken, verify_access_token
+
+
+class KeywordAuthentication(BaseAuthentication):
+    """Reads ``Authorization: <keyword> <credential>`` and passes it to ``verify``."""
+    keyword = None
+
+    def verify(self, credential):
+        raise NotImplementedError
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed('Invalid token header.')
+
+        try:
+            credential = auth[1].decode()
+            return self.verify(credential), credential
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed('Invalid token header.')
+        except InvalidToken as exc:
+            raise exceptions.AuthenticationFailed(str(exc))
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+class SignedTokenAuthentication(KeywordAuthentication):
+    """
+    DRF authentication for ``Authorization: Bearer <access token>``.
+    Verifies the token signature only; no database query per request.
+    """
+    keyword = 'Bearer'
+
+    def verify(self, credential):
+        return verify_access_token(credential)
+
+
+class APIKeyAuthentication(KeywordAuthentication):
+    """
+    DRF authentication for ``Authorization: Api-Key <prefix>.<secret>``.
+    One indexed lookup and a constant-time compare, then served from an
+    in-process LRU while the key stays in use.
+    """
+    keyword = 'Api-Key'
+
+    def verify(self, credential):
+        return verify_api_key(credential)
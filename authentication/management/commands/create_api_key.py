@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from authentication.models import APIKey
+
+
+class Command(BaseCommand):
+    help = 'Create an API key for a machine client acting as the given user'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', type=str, help='User the key authenticates as')
+        parser.add_argument('--name', type=str, required=True, help='What the key is for, e.g. "frontend build"')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(**{User.USERNAME_FIELD: options['username']})
+        except User.DoesNotExist:
+            raise CommandError(f"User not found: {options['username']}")
+
+        api_key, raw_key = APIKey.objects.create_key(options['name'], user)
+        self.stdout.write(self.style.SUCCESS(f'Created API key {api_key}. Store it now; it cannot be shown again:'))
+        self.stdout.write(raw_key)
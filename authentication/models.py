@@ -0,0 +1,43 @@
+import hashlib
+import secrets
+
+from django.conf import settings
+from django.db import models
+
+
+class APIKeyManager(models.Manager):
+    def create_key(self, name, user):
+        """
+        Create a key for ``user`` and return ``(api_key, raw_key)``.
+        The raw key is only available here; the database keeps its hash.
+        """
+        prefix = secrets.token_hex(4)
+        secret = secrets.token_urlsafe(32)
+        api_key = self.create(name=name, user=user, prefix=prefix, key_hash=hash_secret(secret))
+        return api_key, f'{prefix}.{secret}'
+
+
+def hash_secret(secret):
+    # Keys carry 256 random bits, so a fast hash is enough; no password hasher needed
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+class APIKey(models.Model):
+    """Credential for machine clients (deploy scripts, frontend builds) acting as ``user``."""
+    name = models.CharField(max_length=100)
+    prefix = models.CharField(max_length=16, unique=True)
+    key_hash = models.CharField(max_length=64)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='api_keys')
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = APIKeyManager()
+
+    class Meta:
+        verbose_name = 'API Key'
+        verbose_name_plural = 'API Keys'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.name} ({self.prefix})"
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .api_keys import verified_keys
+from .models import APIKey
+
+
+@receiver([post_save, post_delete], sender=APIKey, dispatch_uid='api_key_cache_discard')
+def discard_verified_key(sender, instance, **kwargs):
+    """Forget a key in this process as soon as it is revoked or changed"""
+    verified_keys.discard(instance.prefix)
@@ -0,0 +1,134 @@
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from .api_keys import verified_keys, verify_api_key
+from .models import APIKey
+from .tokens import InvalidToken, issue_tokens
+
+PROTECTED_URL = '/api/stats/'
+
+
+class CredentialTestCase(TestCase):
+    def assertRejected(self, response, detail):
+        # 403 rather than 401: SessionAuthentication, listed first, sends no
+        # WWW-Authenticate challenge
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['detail'], detail)
+
+
+class SignedTokenTests(CredentialTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('editor', password='correct horse')
+
+    def get(self, credentials):
+        return self.client.get(PROTECTED_URL, HTTP_AUTHORIZATION=credentials)
+
+    def assertRejected(self, response, detail='Invalid token.'):
+        super().assertRejected(response, detail)
+
+    def refresh(self, token):
+        return self.client.post('/api/auth/token/refresh/', {'refresh': token}, content_type='application/json')
+
+    def test_access_token_is_accepted(self):
+        tokens = self.client.post(
+            '/api/auth/token/', {'username': 'editor', 'password': 'correct horse'},
+            content_type='application/json',
+        ).json()
+        self.assertEqual(self.get(f"Bearer {tokens['access']}").status_code, 200)
+
+    def test_wrong_password_gets_no_tokens(self):
+        response = self.client.post(
+            '/api/auth/token/', {'username': 'editor', 'password': 'wrong'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_expired_access_token_is_rejected(self):
+        issued_at = time.time() - settings.AUTH_ACCESS_TOKEN_LIFETIME - 1
+        with mock.patch('time.time', return_value=issued_at):
+            tokens = issue_tokens(self.user)
+        self.assertRejected(self.get(f"Bearer {tokens['access']}"), 'Token has expired.')
+
+    def test_tampered_access_token_is_rejected(self):
+        access = issue_tokens(self.user)['access']
+        self.assertRejected(self.get(f'Bearer {access[:-2]}xx'))
+
+    def test_refresh_token_is_not_an_access_token(self):
+        refresh = issue_tokens(self.user)['refresh']
+        self.assertRejected(self.get(f'Bearer {refresh}'))
+
+    def test_access_token_is_not_a_refresh_token(self):
+        access = issue_tokens(self.user)['access']
+        self.assertEqual(self.refresh(access).status_code, 401)
+
+    def test_refresh_issues_a_new_pair(self):
+        response = self.refresh(issue_tokens(self.user)['refresh'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get(f"Bearer {response.json()['access']}").status_code, 200)
+
+    def test_refresh_token_is_revoked_by_a_password_change(self):
+        refresh = issue_tokens(self.user)['refresh']
+        self.user.set_password('new password')
+        self.user.save()
+        self.assertEqual(self.refresh(refresh).status_code, 401)
+
+    def test_refresh_token_is_revoked_by_deactivation(self):
+        refresh = issue_tokens(self.user)['refresh']
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.refresh(refresh).status_code, 401)
+
+
+class APIKeyTests(CredentialTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('machine')
+        cls.api_key, cls.raw_key = APIKey.objects.create_key('deploy', cls.user)
+
+    def setUp(self):
+        verified_keys.clear()
+
+    def get(self, raw_key):
+        return self.client.get(PROTECTED_URL, HTTP_AUTHORIZATION=f'Api-Key {raw_key}')
+
+    def assertRejected(self, response, detail='Invalid API key.'):
+        super().assertRejected(response, detail)
+
+    def wrong_secret(self):
+        return f'{self.api_key.prefix}.{"x" * 32}'
+
+    def test_key_is_accepted_and_then_served_from_the_cache(self):
+        self.assertEqual(self.get(self.raw_key).status_code, 200)
+        with self.assertNumQueries(0):
+            user = verify_api_key(self.raw_key)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_only_the_hash_is_stored(self):
+        self.assertNotIn(self.raw_key.partition('.')[2], self.api_key.key_hash)
+
+    def test_wrong_secret_is_rejected(self):
+        self.assertRejected(self.get(self.wrong_secret()))
+
+    def test_wrong_secret_is_rejected_on_a_cache_hit(self):
+        verify_api_key(self.raw_key)
+        self.assertIsNotNone(verified_keys.get(self.api_key.prefix))
+        with self.assertNumQueries(0), self.assertRaises(InvalidToken):
+            verify_api_key(self.wrong_secret())
+        self.assertRejected(self.get(self.wrong_secret()))
+
+    def test_deactivating_the_key_drops_the_cached_entry(self):
+        verify_api_key(self.raw_key)
+        self.api_key.is_active = False
+        self.api_key.save()
+        self.assertIsNone(verified_keys.get(self.api_key.prefix))
+        self.assertRejected(self.get(self.raw_key))
+
+    def test_key_of_an_inactive_user_is_rejected(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertRejected(self.get(self.raw_key))
@@ -0,0 +1,33 @@
+from django.contrib.auth import authenticate
+from rest_framework import status
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from .tokens import InvalidToken, issue_tokens, refresh_tokens
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def obtain_token(request):
+    """Exchange a username and password for an access/refresh token pair"""
+    user = authenticate(
+        request,
+        username=request.data.get('username'),
+        password=request.data.get('password'),
+    )
+    if user is None:
+        return Response({'error': 'Invalid username or password.'}, status=status.HTTP_401_UNAUTHORIZED)
+    return Response(issue_tokens(user))
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def refresh_token(request):
+    """Exchange a refresh token for a new token pair"""
+    try:
+        return Response(refresh_tokens(request.data.get('refresh') or ''))
+    except InvalidToken as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_401_UNAUTHORIZED)
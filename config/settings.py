@@ -31,6 +31,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',
+    'authentication',
     'content',
     'dashboard',
 ]
@@ -71,9 +72,73 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Take the write lock when a transaction starts. With SQLite's
+            # default (DEFERRED), two transactions that read and then write
+            # fail with "database is locked" instead of waiting for each other.
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Cache (holds the precomputed homepage snapshot)
+# Set REDIS_URL so every worker sees a rebuilt snapshot immediately. The
+# local-memory fallback is per-process, so its entries expire after
+# HOMEPAGE_CACHE_TIMEOUT seconds instead.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+    HOMEPAGE_CACHE_TIMEOUT = None
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    HOMEPAGE_CACHE_TIMEOUT = int(os.environ.get('HOMEPAGE_CACHE_TIMEOUT', 60))
+
+# Clients of /api/homepage/changes/ more than this many published versions
+# behind get a full snapshot instead of a delta
+HOMEPAGE_CHANGES_MAX_LAG = int(os.environ.get('HOMEPAGE_CHANGES_MAX_LAG', 50))
+
+# /api/homepage/events/ (Server-Sent Events): how often each open stream
+# polls the database for changes made by other worker processes, and how
+# long clients wait before reconnecting
+HOMEPAGE_EVENTS_POLL_INTERVAL = int(os.environ.get('HOMEPAGE_EVENTS_POLL_INTERVAL', 15))
+HOMEPAGE_EVENTS_RETRY_MS = 5000
+
+# Static homepage export (see `manage.py export_homepage`)
+# When set, the JSON file and its .gz/.br siblings are rewritten every time
+# content is published, so a static file server or CDN origin can serve them.
+HOMEPAGE_EXPORT_PATH = os.environ.get('HOMEPAGE_EXPORT_PATH')
+
+# Locally stored media (uploads); images under MEDIA_URL get placeholders
+MEDIA_URL = '/media/'
+MEDIA_ROOT = Path(os.environ.get('MEDIA_ROOT', BASE_DIR / 'media'))
+
+# Low-quality image placeholders (see content.placeholders): edge length in
+# px of the blurred preview, worker processes (None = one per CPU), and
+# whether saving content generates missing placeholders in the background
+IMAGE_PLACEHOLDER_SIZE = 16
+IMAGE_PLACEHOLDER_WORKERS = int(os.environ['IMAGE_PLACEHOLDER_WORKERS']) if os.environ.get('IMAGE_PLACEHOLDER_WORKERS') else None
+IMAGE_PLACEHOLDERS_ON_SAVE = True
+
+# On-demand resizing of local images (/api/images/, see content.resize):
+# where encoded variants are cached, the most disk they may use, and the
+# encoder quality
+IMAGE_CACHE_ROOT = Path(os.environ.get('IMAGE_CACHE_ROOT', BASE_DIR / 'cache' / 'images'))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get('IMAGE_CACHE_MAX_BYTES', 1024 ** 3))
+IMAGE_RESIZE_QUALITY = 80
+
+# Widths (px) of the responsive variants stored with each media asset; also
+# the only widths /api/images/ will produce.
+# Run `manage.py refresh_media_variants` after changing them.
+MEDIA_VARIANT_WIDTHS = [320, 640, 960, 1280, 1920]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -112,10 +177,20 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.BasicAuthentication',
+        'authentication.backends.SignedTokenAuthentication',
+        'authentication.backends.APIKeyAuthentication',
     ],
 }
 
+# Signed API tokens (see authentication.tokens), lifetimes in seconds
+AUTH_ACCESS_TOKEN_LIFETIME = int(os.environ.get('AUTH_ACCESS_TOKEN_LIFETIME', 15 * 60))
+AUTH_REFRESH_TOKEN_LIFETIME = int(os.environ.get('AUTH_REFRESH_TOKEN_LIFETIME', 7 * 24 * 60 * 60))
+
+# API keys for machine clients (see authentication.api_keys): how many
+# verified keys each process remembers, and for how many seconds
+API_KEY_CACHE_SIZE = 256
+API_KEY_CACHE_TTL = 60
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -1,6 +1,8 @@
 """
 URL configuration for Centaura CMS project.
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
@@ -20,7 +22,10 @@ def root_view(request):
 urlpatterns = [
     path('', root_view, name='root'),
     path('admin/', admin.site.urls),
+    path('api/auth/', include('authentication.urls')),
     path('api/', include('content.urls')),
     path('dashboard/', include('dashboard.urls')),
 ]
 
+# Uploaded media, served by Django only in development
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
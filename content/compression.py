@@ -0,0 +1,75 @@
+"""
+Pre-compressed response bodies.
+
+Public content payloads only change when content is written, so their gzip
+and brotli encodings are produced once per content version and cached next
+to the payload. Each request just picks the variant its Accept-Encoding
+allows.
+"""
+import gzip
+
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; only gzip variants are produced without it
+    brotli = None
+
+# Preferred first when a client accepts several encodings equally
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+
+def compress_payload(payload):
+    """Return ``{content_encoding: compressed_bytes}`` for every supported encoding."""
+    variants = {'gzip': gzip.compress(payload, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(payload, mode=brotli.MODE_TEXT)
+    return variants
+
+
+def parse_accept_encoding(header):
+    """Return ``{encoding: q}`` from an Accept-Encoding header."""
+    accepted = {}
+    for item in header.split(','):
+        encoding, _, params = item.strip().partition(';')
+        if not encoding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[encoding.lower()] = q
+    return accepted
+
+
+def choose_encoding(header, available):
+    """Pick the best encoding in ``available`` for an Accept-Encoding header, or None."""
+    accepted = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in available:
+            continue
+        q = accepted.get(encoding, accepted.get('*', 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def encoded_json_response(request, payload, variants):
+    """
+    Return ``payload`` as a JSON response, using the pre-compressed variant
+    that matches the request's Accept-Encoding when there is one.
+    """
+    encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), variants)
+    body = variants[encoding] if encoding else payload
+    response = HttpResponse(body, content_type='application/json')
+    if encoding:
+        response['Content-Encoding'] = encoding
+    response['Content-Length'] = str(len(body))
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
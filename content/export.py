@@ -0,0 +1,49 @@
+"""
+Static export of the homepage payload.
+
+Writes the exact bytes served by /api/homepage/ (the latest published
+snapshot) to a JSON file, plus gzip and
+brotli siblings, so a static file server or CDN origin can serve the homepage
+without Django. Files are written to a temp file and moved into place with
+os.replace, so readers never see a partial file.
+"""
+import os
+import tempfile
+
+from django.conf import settings
+
+from .publishing import get_published_snapshot
+from .snapshot import get_encoded_snapshot
+
+
+def write_atomic(path, data):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def export_homepage(path=None, snapshot=None):
+    """
+    Write a published snapshot's payload to ``path`` and its compressed siblings.
+    Returns the list of files written.
+    """
+    path = os.path.join(settings.BASE_DIR, path or settings.HOMEPAGE_EXPORT_PATH)
+    snapshot = get_published_snapshot() if snapshot is None else snapshot
+
+    suffixes = {'gzip': '.gz', 'br': '.br'}
+    written = [path]
+    write_atomic(path, snapshot.payload)
+    for encoding, data in get_encoded_snapshot(snapshot).items():
+        write_atomic(path + suffixes[encoding], data)
+        written.append(path + suffixes[encoding])
+    return written
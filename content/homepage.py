@@ -0,0 +1,390 @@
+"""
+Builds the aggregated homepage payload served by the public API.
+
+The payload is split into sections. Each section has its own builder and the
+list of models it reads, so a write to one model only rebuilds the sections
+that depend on it.
+
+Builders read ``values()`` rows rather than model instances, so every
+section runs a fixed number of queries no matter how many rows it holds.
+Sections built together share their queries where they can: the single row
+of every singleton section (hero, footer, ...) comes back from one SELECT
+(``load_singletons``), and the image placeholders of all of them from one
+lookup (``resolve_placeholders``). ``SECTION_QUERY_BUDGET`` records what each
+section costs on its own and ``HOMEPAGE_QUERY_BUDGET`` what a full build
+costs; content.tests enforces both against seeded content, and
+``manage.py check_homepage_queries`` reports them for the configured database.
+
+Sections with images embed each one's placeholder (dimensions and a blurred
+preview, see content.placeholders) next to its URL, or None if the image
+has none.
+"""
+from django.db.models import CharField, F, Func, JSONField, Subquery, Value
+from django.db.models.functions import JSONObject
+
+from .models import (
+    Hero, Stat, BrutalMathSection, BrutalMathStat, WhyCentauraSection,
+    WhyCentauraFeature, Service, ComparisonTable, ComparisonTableFeature,
+    PortfolioProject, PeopleBehindStrategy, WhyWeBuiltSection, ProcessSection,
+    ProcessStep, FinalWordSection, Footer, MediaAsset, ImagePlaceholder
+)
+
+
+class _JSONColumn(Func):
+    """A JSONField column, nested as JSON rather than as a string inside JSONObject."""
+    template = '%(expressions)s'
+    output_field = JSONField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # SQLite keeps JSON as text; JSON() marks it as JSON for JSON_OBJECT
+        return super().as_sql(compiler, connection, template='JSON(%(expressions)s)', **extra_context)
+
+
+def _singleton_value(model, field):
+    if isinstance(model._meta.get_field(field), JSONField):
+        return _JSONColumn(F(field))
+    return F(field)
+
+
+# Singleton section name -> (model, fields its builder reads from the row)
+SINGLETON_FIELDS = {
+    'hero': (Hero, (
+        'title', 'subtitle', 'cta_text', 'cta_link', 'background_image', 'quote',
+        'founders_names', 'founders_title', 'founders_images',
+    )),
+    'brutal_math': (BrutalMathSection, ('title', 'subtitle', 'closing_text')),
+    'why_centaura': (WhyCentauraSection, ('label', 'title', 'image_url', 'cta_text', 'cta_url')),
+    'comparison_table': (ComparisonTable, ('id', 'title', 'subtitle', 'cta_text', 'cta_url')),
+    'people_behind_strategy': (PeopleBehindStrategy, (
+        'title', 'intro',
+        'jane_name', 'jane_title', 'jane_image_url', 'jane_bio',
+        'aimun_name', 'aimun_title', 'aimun_image_url', 'aimun_bio',
+        'cta_text', 'cta_url',
+    )),
+    'why_we_built': (WhyWeBuiltSection, ('left_title', 'left_content', 'right_title', 'right_content')),
+    'process': (ProcessSection, ('id', 'label', 'title', 'cta_text', 'cta_url')),
+    'final_word': (FinalWordSection, ('label', 'title', 'content', 'background_image', 'cta_text', 'cta_url')),
+    'footer': (Footer, ('copyright_text', 'content')),
+}
+
+
+def load_singletons(names):
+    """
+    Return ``{name: row}`` for the named singleton sections, where ``row`` is
+    a dict of the first (lowest pk) row's fields, or None for an empty table.
+    All of them are read in one SELECT: a UNION ALL of one JSON object per
+    table.
+    """
+    queries = []
+    for name in names:
+        model, fields = SINGLETON_FIELDS[name]
+        first = model.objects.order_by('pk').values('pk')[:1]
+        queries.append(model.objects.filter(pk=Subquery(first)).values(
+            section=Value(name, output_field=CharField()),
+            row=JSONObject(**{field: _singleton_value(model, field) for field in fields}),
+        ))
+    rows = dict.fromkeys(names)
+    if queries:
+        query = queries[0].union(*queries[1:], all=True) if len(queries) > 1 else queries[0]
+        rows.update((result['section'], result['row']) for result in query)
+    return rows
+
+
+def image_placeholders(*urls):
+    """Return ``{url: {width, height, lqip}}`` for those of ``urls`` that have a placeholder."""
+    urls = [url for url in urls if url]
+    if not urls:
+        return {}
+    return {
+        row.pop('url'): row
+        for row in ImagePlaceholder.objects.filter(url__in=urls).values('url', 'width', 'height', 'lqip')
+    }
+
+
+class _Placeholder:
+    """Stands in for the placeholder of ``url`` until resolve_placeholders() looks it up."""
+    __slots__ = ('url',)
+
+    def __init__(self, url):
+        self.url = url
+
+
+def _placeholder_slots(value):
+    """Yield ``(container, key)`` for every _Placeholder in nested dicts and lists."""
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return
+    for key, item in items:
+        if isinstance(item, _Placeholder):
+            yield value, key
+        else:
+            yield from _placeholder_slots(item)
+
+
+def resolve_placeholders(data):
+    """Replace every placeholder stand-in in ``data``, looking them all up in one query."""
+    slots = list(_placeholder_slots(data))
+    placeholders = image_placeholders(*{container[key].url for container, key in slots})
+    for container, key in slots:
+        container[key] = placeholders.get(container[key].url)
+    return data
+
+
+def build_hero(hero):
+    if not hero:
+        return {}
+    founders_images = [url for url in hero['founders_images'] if isinstance(url, str)]
+    return {
+        'title': hero['title'],
+        'subtitle': hero['subtitle'],
+        'cta_text': hero['cta_text'],
+        'cta_url': hero['cta_link'],
+        'background_image_url': hero['background_image'],
+        'background_image_placeholder': _Placeholder(hero['background_image']),
+        'quote': hero['quote'],
+        'founders': {
+            'names': hero['founders_names'],
+            'title': hero['founders_title'],
+            'images': hero['founders_images'],
+            'image_placeholders': [_Placeholder(url) for url in founders_images],
+        }
+    }
+
+
+def build_stats():
+    return list(Stat.objects.order_by('sort_order').values('label', 'value'))
+
+
+def build_brutal_math(section):
+    if not section:
+        return {}
+    return {
+        'title': section['title'],
+        'subtitle': section['subtitle'],
+        'statistics': list(
+            BrutalMathStat.objects.order_by('sort_order').values('value', 'description')
+        ),
+        'closing_text': section['closing_text'],
+    }
+
+
+def build_why_centaura(section):
+    if not section:
+        return {}
+    return {
+        'label': section['label'],
+        'title': section['title'],
+        'image_url': section['image_url'],
+        'image_placeholder': _Placeholder(section['image_url']),
+        'features': list(
+            WhyCentauraFeature.objects.order_by('sort_order').values('title', 'description')
+        ),
+        'cta_text': section['cta_text'],
+        'cta_url': section['cta_url'],
+    }
+
+
+def build_services():
+    return list(
+        Service.objects.order_by('sort_order').values('label', 'title', 'description', 'outcome')
+    )
+
+
+def build_comparison_table(comparison_table):
+    if not comparison_table:
+        return {}
+    return {
+        'title': comparison_table['title'],
+        'subtitle': comparison_table['subtitle'],
+        'features': list(
+            ComparisonTableFeature.objects.filter(comparison_table_id=comparison_table['id'])
+            .order_by('sort_order').values('name', 'typical', 'centaura')
+        ),
+        'cta_text': comparison_table['cta_text'],
+        'cta_url': comparison_table['cta_url'],
+    }
+
+
+def build_case_studies():
+    projects = list(
+        PortfolioProject.objects.filter(is_active=True).order_by('sort_order').values(
+            'category', 'title', 'description', 'image_url',
+        )
+    )
+    for project in projects:
+        project['image_placeholder'] = _Placeholder(project['image_url'])
+    return projects
+
+
+def build_people_behind_strategy(people):
+    if not people:
+        return {}
+    return {
+        'title': people['title'],
+        'intro': people['intro'],
+        'jane': {
+            'name': people['jane_name'],
+            'title': people['jane_title'],
+            'image_url': people['jane_image_url'],
+            'image_placeholder': _Placeholder(people['jane_image_url']),
+            'bio': people['jane_bio'],
+        },
+        'aimun': {
+            'name': people['aimun_name'],
+            'title': people['aimun_title'],
+            'image_url': people['aimun_image_url'],
+            'image_placeholder': _Placeholder(people['aimun_image_url']),
+            'bio': people['aimun_bio'],
+        },
+        'cta_text': people['cta_text'],
+        'cta_url': people['cta_url'],
+    }
+
+
+def build_why_we_built(why_built):
+    if not why_built:
+        return {}
+    return {
+        'left': {
+            'title': why_built['left_title'],
+            'content': why_built['left_content'],
+        },
+        'right': {
+            'title': why_built['right_title'],
+            'content': why_built['right_content'],
+        },
+    }
+
+
+def build_process(process_section):
+    if not process_section:
+        return {}
+    return {
+        'label': process_section['label'],
+        'title': process_section['title'],
+        'steps': list(
+            ProcessStep.objects.filter(process_section_id=process_section['id'])
+            .order_by('sort_order').values('number', 'title', 'description')
+        ),
+        'cta_text': process_section['cta_text'],
+        'cta_url': process_section['cta_url'],
+    }
+
+
+def build_final_word(final_word):
+    return final_word or {}
+
+
+def build_footer(footer):
+    if not footer:
+        return {}
+    footer_data = footer['content']
+    footer_data['copyright'] = footer['copyright_text']
+    return footer_data
+
+
+def build_image_gallery():
+    gallery_images = MediaAsset.objects.filter(folder='gallery').order_by('-created_at')
+    return [
+        {'url': url, 'alt': public_id, 'srcset': srcset, 'placeholder': _Placeholder(url)}
+        for url, public_id, srcset in gallery_images.values_list('url', 'public_id', 'srcset')[:4]
+    ]
+
+
+# Bump whenever a builder changes the shape of its section: stored snapshots
+# and cached sections built under another version are rebuilt in full
+HOMEPAGE_SCHEMA_VERSION = 1
+
+# Section name -> builder, in payload order
+HOMEPAGE_SECTIONS = {
+    'hero': build_hero,
+    'stats': build_stats,
+    'brutal_math': build_brutal_math,
+    'why_centaura': build_why_centaura,
+    'services': build_services,
+    'comparison_table': build_comparison_table,
+    'case_studies': build_case_studies,
+    'people_behind_strategy': build_people_behind_strategy,
+    'why_we_built': build_why_we_built,
+    'process': build_process,
+    'final_word': build_final_word,
+    'footer': build_footer,
+    'image_gallery': build_image_gallery,
+}
+
+# Section name -> models its builder reads
+SECTION_MODELS = {
+    'hero': (Hero, ImagePlaceholder),
+    'stats': (Stat,),
+    'brutal_math': (BrutalMathSection, BrutalMathStat),
+    'why_centaura': (WhyCentauraSection, WhyCentauraFeature, ImagePlaceholder),
+    'services': (Service,),
+    'comparison_table': (ComparisonTable, ComparisonTableFeature),
+    'case_studies': (PortfolioProject, ImagePlaceholder),
+    'people_behind_strategy': (PeopleBehindStrategy, ImagePlaceholder),
+    'why_we_built': (WhyWeBuiltSection,),
+    'process': (ProcessSection, ProcessStep),
+    'final_word': (FinalWordSection,),
+    'footer': (Footer,),
+    'image_gallery': (MediaAsset, ImagePlaceholder),
+}
+
+
+# Section name -> maximum queries it runs when built on its own: one per
+# table it reads
+SECTION_QUERY_BUDGET = {
+    'hero': 2,
+    'stats': 1,
+    'brutal_math': 2,
+    'why_centaura': 3,
+    'services': 1,
+    'comparison_table': 2,
+    'case_studies': 2,
+    'people_behind_strategy': 2,
+    'why_we_built': 1,
+    'process': 2,
+    'final_word': 1,
+    'footer': 1,
+    'image_gallery': 2,
+}
+# A full build: one SELECT for every singleton row, one per list or child
+# table (stats, brutal math stats, why-Centaura features, services,
+# comparison features, case studies, process steps, gallery) and one
+# placeholder lookup
+HOMEPAGE_QUERY_BUDGET = 10
+
+
+def sections_for_model(model):
+    """Return the names of the sections that read from ``model``."""
+    return [name for name, models in SECTION_MODELS.items() if model in models]
+
+
+def build_sections(names):
+    """
+    Return ``{name: data}`` for the named sections, in the order given.
+    Their singleton rows are loaded in one query and their image
+    placeholders in another.
+    """
+    singletons = load_singletons([name for name in names if name in SINGLETON_FIELDS])
+    return resolve_placeholders({
+        name: (
+            HOMEPAGE_SECTIONS[name](singletons[name]) if name in SINGLETON_FIELDS
+            else HOMEPAGE_SECTIONS[name]()
+        )
+        for name in names
+    })
+
+
+def build_section(name):
+    return build_sections([name])[name]
+
+
+def build_homepage_data():
+    """
+    Return all homepage content as a single dict.
+    This matches the structure of the content seed JSON for easy React consumption.
+    """
+    return build_sections(list(HOMEPAGE_SECTIONS))
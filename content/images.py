@@ -0,0 +1,174 @@
+"""
+Image URLs: the local files behind them, their content hashes and their
+responsive variants.
+
+An image's content hash identifies it for deduplication. A local file is
+hashed by its bytes; a remote image, which is not downloaded, by its
+normalized URL, so the same CDN URL stored twice is still recognised.
+
+Images are resized on the fly by the server that hosts them, through URL
+parameters: the CDNs below, or /api/images/ (content.resize) for files under
+MEDIA_URL. A width variant is therefore only a URL rewrite. Variants are
+computed when an asset is written and stored with it, so readers never build
+them per request.
+"""
+import hashlib
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.http.request import validate_host
+from django.urls import reverse
+
+
+def media_path(relative):
+    """Return the file ``relative`` names under MEDIA_ROOT, or None if there is none."""
+    root = Path(settings.MEDIA_ROOT).resolve()
+    path = (root / relative).resolve()
+    if root not in path.parents or not path.is_file():
+        return None
+    return path
+
+
+def local_image_path(url):
+    """Return the file under MEDIA_ROOT that ``url`` serves, or None if it is not a local image."""
+    parts = urlsplit(url)
+    if parts.netloc and not validate_host(parts.hostname or '', settings.ALLOWED_HOSTS):
+        return None
+    if not parts.path.startswith(settings.MEDIA_URL):
+        return None
+    return media_path(unquote(parts.path[len(settings.MEDIA_URL):]))
+
+
+def file_content_hash(url):
+    """SHA-256 hex digest of the local file ``url`` serves, or None for other URLs."""
+    path = local_image_path(url) if url else None
+    if path is None:
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize_url(url):
+    """
+    ``url`` reduced to what identifies the image: scheme-relative (http and
+    https serve the same file), lowercase host, no default port or fragment,
+    query parameters sorted.
+    """
+    parts = urlsplit(url.strip())
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    host = parts.hostname or ''
+    netloc = host if port in (None, 80, 443) else f'{host}:{port}'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(('', netloc, parts.path or '/', query, ''))
+
+
+def url_content_hash(url):
+    """SHA-256 hex digest of the normalized ``url``, for images that are not stored locally."""
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+
+def content_hash(url):
+    """The content hash of the image ``url`` serves (see the module docstring), or None without a URL."""
+    if not url:
+        return None
+    return file_content_hash(url) or url_content_hash(url)
+
+
+def _cloudinary_variant(parts, width):
+    # https://res.cloudinary.com/<cloud>/image/upload/[<transformations>/]v1/<public_id>
+    # c_limit never upscales; f_auto/q_auto let the CDN pick AVIF/WebP/JPEG per client
+    if '/upload/' not in parts.path:
+        return None
+    path = parts.path.replace('/upload/', f'/upload/c_limit,w_{width},f_auto,q_auto/', 1)
+    return urlunsplit(parts._replace(path=path))
+
+
+def _imgix_variant(parts, width):
+    # Unsplash (imgix) takes w/h query parameters; keep the aspect ratio of a fixed crop
+    query = dict(parse_qsl(parts.query))
+    if 'w' in query and 'h' in query and query['w'].isdigit() and query['h'].isdigit():
+        query['h'] = str(round(int(query['h']) * width / int(query['w'])))
+    query.update(w=str(width), auto='format')
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _local_variant(parts, width):
+    # Files under MEDIA_URL go through the resize endpoint, which negotiates the
+    # format. Keep the scheme and host: the frontend is served from another origin.
+    if not parts.path.startswith(settings.MEDIA_URL):
+        return None
+    path = reverse('content-resized-image', args=[unquote(parts.path[len(settings.MEDIA_URL):])])
+    return urlunsplit(parts._replace(path=path, query=f'w={width}', fragment=''))
+
+
+# CDN host -> function building the URL of a given width, or returning None
+# for a URL it cannot resize. URLs on this site use _local_variant.
+VARIANT_BUILDERS = {
+    'res.cloudinary.com': _cloudinary_variant,
+    'images.unsplash.com': _imgix_variant,
+}
+
+
+def responsive_variants(url):
+    """
+    Return ``[{width, format, url}, ...]`` for every width in
+    MEDIA_VARIANT_WIDTHS, or [] when ``url`` is not on a host that can resize.
+    ``format`` is "auto": the server negotiates it from the Accept header.
+    """
+    if not url:
+        return []
+    parts = urlsplit(url)
+    builder = VARIANT_BUILDERS.get(parts.hostname)
+    if builder is None and (not parts.netloc or validate_host(parts.hostname or '', settings.ALLOWED_HOSTS)):
+        builder = _local_variant
+    if builder is None or builder(parts, settings.MEDIA_VARIANT_WIDTHS[0]) is None:
+        return []
+    return [
+        {'width': width, 'format': 'auto', 'url': builder(parts, width)}
+        for width in settings.MEDIA_VARIANT_WIDTHS
+    ]
+
+
+def srcset(variants):
+    return ', '.join(f"{variant['url']} {variant['width']}w" for variant in variants)
+
+
+def make_placeholder(path, size):
+    """
+    Return ``{width, height, lqip}`` for the image file at ``path``: its
+    displayed dimensions and a ``size``-pixel JPEG data URI the frontend can
+    stretch and blur until the real image loads.
+
+    Runs in worker processes, so it takes plain arguments and touches
+    neither settings nor the database. Returns None for unreadable files.
+    """
+    import base64
+    import io
+
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(path) as image:
+            width, height = image.size
+            # EXIF orientations 5-8 are rotated by 90 degrees when displayed
+            if image.getexif().get(0x0112) in (5, 6, 7, 8):
+                width, height = height, width
+            # Let the JPEG decoder downscale while decoding instead of after
+            image.draft('RGB', (size * 8, size * 8))
+            # Rotate the pixels the same way, so the preview matches its dimensions
+            image = ImageOps.exif_transpose(image)
+            image = image.convert('RGB')
+            image.thumbnail((size, size))
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=40, optimize=True)
+    except (OSError, UnidentifiedImageError):
+        return None
+    encoded = base64.b64encode(buffer.getvalue()).decode('ascii')
+    return {'width': width, 'height': height, 'lqip': f'data:image/jpeg;base64,{encoded}'}
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from content.models import MediaAsset
+from content.row_serializers import row_serializer_for, serializer_field_names
+from content.serializers import MediaAssetSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Time MediaAssetSerializer against the values_list() row path used by the content list '
+        'endpoints. Rows are inserted in a transaction that is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+
+    def handle(self, *args, **options):
+        row_serializer = row_serializer_for(MediaAssetSerializer, serializer_field_names(MediaAssetSerializer))
+
+        with transaction.atomic():
+            inserted = 0
+            for size in sorted(options['sizes']):
+                MediaAsset.objects.bulk_create(
+                    [self.asset(n) for n in range(inserted, size)], batch_size=1000,
+                )
+                inserted = max(inserted, size)
+                queryset = MediaAsset.objects.filter(public_id__startswith='benchmark/')
+
+                started = time.perf_counter()
+                expected = MediaAssetSerializer(queryset, many=True).data
+                serializer_time = time.perf_counter() - started
+
+                started = time.perf_counter()
+                actual = row_serializer.serialize(queryset.values_list(*row_serializer.columns))
+                row_time = time.perf_counter() - started
+
+                if actual != expected:
+                    raise CommandError(f'Row serializer output differs from MediaAssetSerializer at {size} rows')
+                self.stdout.write(
+                    f'{size:>7} rows: ModelSerializer {serializer_time * 1000:8.1f} ms, '
+                    f'rows {row_time * 1000:8.1f} ms ({serializer_time / row_time:.1f}x)'
+                )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def asset(n):
+        url = f'https://example.com/benchmark/{n}.jpg'
+        return MediaAsset(
+            public_id=f'benchmark/{n}', url=url, secure_url=url, web_url=url,
+            thumbnail_url=url, folder='benchmark',
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from content.homepage import (
+    HOMEPAGE_QUERY_BUDGET, HOMEPAGE_SECTIONS, SECTION_QUERY_BUDGET, build_homepage_data, build_section
+)
+
+
+class Command(BaseCommand):
+    help = 'Fail if any homepage section, or the full homepage, runs more queries than its documented budget'
+
+    def handle(self, *args, **options):
+        missing = set(HOMEPAGE_SECTIONS) - set(SECTION_QUERY_BUDGET)
+        if missing:
+            raise CommandError(f'No query budget for sections: {", ".join(sorted(missing))}')
+
+        # Probed with a query on first use; keep it out of the counts
+        connection.features.supports_json_field
+
+        over_budget = []
+        for name in HOMEPAGE_SECTIONS:
+            with CaptureQueriesContext(connection) as ctx:
+                build_section(name)
+            count = len(ctx.captured_queries)
+            self.stdout.write(f'{name}: {count}/{SECTION_QUERY_BUDGET[name]}')
+            if count > SECTION_QUERY_BUDGET[name]:
+                over_budget.append(name)
+
+        with CaptureQueriesContext(connection) as ctx:
+            build_homepage_data()
+        total = len(ctx.captured_queries)
+        if total > HOMEPAGE_QUERY_BUDGET:
+            over_budget.append('homepage')
+
+        if over_budget:
+            raise CommandError(f'Over query budget: {", ".join(over_budget)}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Homepage ran {total} queries (budget {HOMEPAGE_QUERY_BUDGET})'
+        ))
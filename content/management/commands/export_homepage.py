@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from content.compression import brotli
+from content.export import export_homepage
+from content.publishing import get_published_snapshot, publish_homepage
+
+
+class Command(BaseCommand):
+    help = 'Write the homepage API response to a JSON file with pre-compressed .gz and .br siblings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=settings.HOMEPAGE_EXPORT_PATH or 'export/homepage.json',
+            help='Path of the JSON file to write (relative to backend directory)',
+        )
+        parser.add_argument(
+            '--publish',
+            action='store_true',
+            help='Publish the current draft before exporting',
+        )
+
+    def handle(self, *args, **options):
+        snapshot = publish_homepage() if options['publish'] else get_published_snapshot()
+        if snapshot is None:
+            raise CommandError('Nothing has been published yet; run with --publish to publish the current draft')
+        if brotli is None:
+            self.stdout.write(self.style.WARNING('brotli is not installed; skipping .br output'))
+
+        for path in export_homepage(options['output'], snapshot=snapshot):
+            self.stdout.write(f'Wrote {path}')
+        self.stdout.write(self.style.SUCCESS('Successfully exported homepage content!'))
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from content.placeholders import generate_placeholders, referenced_image_urls
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate dimensions and blurred previews for every locally stored image referenced '
+        'by the media library or the homepage content'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, help='Worker processes (default: IMAGE_PLACEHOLDER_WORKERS)')
+        parser.add_argument('--force', action='store_true', help='Regenerate existing placeholders too')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        generated, failed = generate_placeholders(
+            referenced_image_urls(), workers=options['workers'], force=options['force'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {generated} placeholders in {time.perf_counter() - started:.1f}s'
+            + (f', {failed} images could not be read' if failed else '')
+        ))
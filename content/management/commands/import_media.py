@@ -0,0 +1,115 @@
+import csv
+import json
+import time
+from itertools import islice
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from content.homepage import sections_for_model
+from content.models import MediaAsset
+from content.snapshot import schedule_homepage_rebuild
+
+URL_FIELDS = ('url', 'secure_url', 'web_url', 'thumbnail_url')
+UPDATE_FIELDS = [*URL_FIELDS, 'folder', 'variants', 'srcset', 'content_hash', 'updated_at']
+
+
+class Command(BaseCommand):
+    help = (
+        'Import media assets from a JSONL or CSV manifest, inserting new public_ids and '
+        'replacing existing ones with the manifest row. Rows whose content_hash (given, else computed '
+        'from a local file or the normalized URL) matches another asset are skipped. The file is streamed, so memory use does not '
+        'grow with its size.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, help='Manifest with one asset per line/row: public_id, url, '
+                                                   'secure_url, web_url, thumbnail_url, folder, content_hash')
+        parser.add_argument('--format', choices=['jsonl', 'csv'], help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive')
+
+        try:
+            manifest = open(path, newline='', encoding='utf-8')
+        except OSError as exc:
+            raise CommandError(f'Cannot open {path}: {exc}')
+
+        started = time.perf_counter()
+        imported = skipped = duplicates = 0
+        with manifest:
+            records = self.read_csv(manifest) if file_format == 'csv' else self.read_jsonl(manifest)
+            assets = self.assets(records)
+            while batch := list(islice(assets, batch_size)):
+                # Keep the last row for a public_id repeated within one batch
+                batch = list({asset.public_id: asset for asset in batch}.values())
+                unique = self.drop_duplicates(batch)
+                duplicates += len(batch) - len(unique)
+                batch = unique
+                if not batch:
+                    continue
+                with transaction.atomic():
+                    MediaAsset.objects.bulk_create(
+                        batch, update_conflicts=True,
+                        unique_fields=['public_id'], update_fields=UPDATE_FIELDS,
+                    )
+                imported += len(batch)
+                self.stdout.write(f'{imported} assets, {imported / (time.perf_counter() - started):.0f}/s')
+            skipped = self.skipped
+
+        # bulk_create sends no post_save, so refresh the gallery section once
+        schedule_homepage_rebuild(sections_for_model(MediaAsset))
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {imported} assets in {elapsed:.1f}s ({imported / elapsed:.0f}/s), '
+            f'skipped {skipped} invalid and {duplicates} duplicate rows'
+        ))
+
+    def read_jsonl(self, manifest):
+        for line_number, line in enumerate(manifest, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as exc:
+                yield line_number, exc
+
+    def read_csv(self, manifest):
+        for line_number, row in enumerate(csv.DictReader(manifest), 2):
+            yield line_number, row
+
+    def assets(self, records):
+        self.skipped = 0
+        for line_number, record in records:
+            if not isinstance(record, dict) or not record.get('public_id'):
+                self.skipped += 1
+                reason = record if isinstance(record, Exception) else 'no public_id'
+                self.stderr.write(f'Line {line_number}: skipped, {reason}')
+                continue
+            asset = MediaAsset(
+                public_id=record['public_id'],
+                folder=record.get('folder') or 'uploads',
+                content_hash=record.get('content_hash') or '',
+                **{field: record.get(field) or None for field in URL_FIELDS},
+            )
+            # bulk_create skips save(), which derives these
+            asset.refresh_variants()
+            asset.refresh_content_hash()
+            yield asset
+
+    def drop_duplicates(self, batch):
+        """Drop rows whose content is already stored under another public_id, here or in the batch."""
+        hashes = {asset.content_hash for asset in batch if asset.content_hash}
+        owners = dict(
+            MediaAsset.objects.filter(content_hash__in=hashes).order_by('-id').values_list('content_hash', 'public_id')
+        )
+        unique = []
+        for asset in batch:
+            owner = owners.setdefault(asset.content_hash, asset.public_id) if asset.content_hash else None
+            if owner is None or owner == asset.public_id:
+                unique.append(asset)
+        return unique
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from content.media import compute_missing_hashes, merge_duplicate_assets
+
+
+class Command(BaseCommand):
+    help = (
+        'Merge media assets with identical content into the oldest copy, pointing content that '
+        'used a duplicate at the kept asset'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report duplicates without merging them (missing content hashes are still stored)',
+        )
+
+    def handle(self, *args, **options):
+        # Also for dry runs, so they report what a real run would merge
+        hashed = compute_missing_hashes()
+        if hashed:
+            self.stdout.write(f'Hashed {hashed} assets')
+
+        groups, removed, references = merge_duplicate_assets(dry_run=options['dry_run'])
+        if options['dry_run']:
+            self.stdout.write(f'{removed} duplicates in {groups} groups would be merged')
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f'Merged {removed} duplicates in {groups} groups, rewrote {references} content references'
+        ))
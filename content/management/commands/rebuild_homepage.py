@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from content.publishing import publish_homepage
+from content.snapshot import rebuild_homepage_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Rebuild every section of the homepage draft snapshot from the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--publish',
+            action='store_true',
+            help='Publish the rebuilt draft',
+        )
+
+    def handle(self, *args, **options):
+        snapshot = rebuild_homepage_snapshot()
+        message = f'Rebuilt homepage draft v{snapshot.version}'
+        if options['publish']:
+            published = publish_homepage()
+            message += f' and published it as v{published.version}'
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from content.search import rebuild_search_index, search_available
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index from the current content'
+
+    def handle(self, *args, **options):
+        if not search_available():
+            raise CommandError('Full-text search needs SQLite (FTS5)')
+        with transaction.atomic():
+            total = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} objects'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from content.homepage import sections_for_model
+from content.models import MediaAsset
+from content.snapshot import schedule_homepage_rebuild
+
+
+class Command(BaseCommand):
+    help = 'Recompute the responsive variants and srcset of every media asset (after changing MEDIA_VARIANT_WIDTHS)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        assets = MediaAsset.objects.only('id', 'url', 'secure_url').order_by('id')
+        updated = 0
+        last_id = 0
+        while batch := list(assets.filter(id__gt=last_id)[:batch_size]):
+            for asset in batch:
+                asset.refresh_variants()
+            with transaction.atomic():
+                MediaAsset.objects.bulk_update(batch, ['variants', 'srcset'])
+            updated += len(batch)
+            last_id = batch[-1].id
+
+        # bulk_update sends no post_save, so refresh the gallery section once
+        schedule_homepage_rebuild(sections_for_model(MediaAsset))
+        self.stdout.write(self.style.SUCCESS(f'Refreshed variants for {updated} assets'))
@@ -8,6 +8,8 @@ from content.models import (
     PortfolioProject, PeopleBehindStrategy, WhyWeBuiltSection, ProcessSection,
     ProcessStep, FinalWordSection, Footer, SocialLink, MediaAsset
 )
+from content.images import content_hash
+from content.media import find_duplicate
 
 
 class Command(BaseCommand):
@@ -233,7 +235,10 @@ class Command(BaseCommand):
                 # Create a simple public_id from the URL
                 url = image_data.get('url', '')
                 public_id = f"gallery_{idx}_{url.split('/')[-1].split('?')[0]}"
-                
+                # Already in the library, perhaps under another index after a reorder
+                if find_duplicate(content_hash(url), exclude_public_id=public_id):
+                    continue
+
                 MediaAsset.objects.get_or_create(
                     public_id=public_id,
                     defaults={
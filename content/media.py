@@ -0,0 +1,152 @@
+"""
+Media library lookups and maintenance.
+"""
+from django.db import transaction
+from django.db.models import Case, Count, Min, Value, When
+
+from .homepage import sections_for_model
+from .models import (
+    SEO, Navigation, Hero, WhyCentauraSection, FinalWordSection, PeopleBehindStrategy,
+    Service, PortfolioProject, Testimonial, MediaAsset
+)
+from .snapshot import schedule_homepage_rebuild
+
+# Model -> fields holding an image URL: the media library itself and the
+# content that points at images. founders_images is a JSON list of URLs.
+IMAGE_FIELDS = {
+    MediaAsset: ('url',),
+    SEO: ('og_image',),
+    Navigation: ('logo_image_url',),
+    Hero: ('background_image', 'founders_images'),
+    WhyCentauraSection: ('image_url',),
+    FinalWordSection: ('background_image',),
+    PeopleBehindStrategy: ('jane_image_url', 'aimun_image_url'),
+    Service: ('image_url',),
+    PortfolioProject: ('image_url',),
+    Testimonial: ('image_url',),
+}
+LIST_FIELDS = {(Hero, 'founders_images')}
+
+
+# Sorts after every character a public_id can contain
+_PREFIX_UPPER_BOUND = '\U0010ffff'
+
+
+def media_typeahead(prefix, folder=None, limit=10, fields=('id', 'public_id', 'thumbnail_url')):
+    """
+    Return up to ``limit`` assets whose public_id starts with ``prefix``
+    (case-sensitive), in public_id order, as dicts of ``fields``.
+
+    The prefix is matched as the range ``prefix <= public_id < prefix + U+10FFFF``
+    rather than ``LIKE 'prefix%'``: SQLite's LIKE is case-insensitive and so
+    cannot use an index. The range seeks the unique public_id index, or the
+    (folder, public_id) index when ``folder`` is given.
+    """
+    assets = MediaAsset.objects.filter(
+        public_id__gte=prefix, public_id__lt=prefix + _PREFIX_UPPER_BOUND,
+    )
+    if folder is not None:
+        assets = assets.filter(folder=folder)
+    return list(assets.order_by('public_id').values(*fields)[:limit])
+
+
+
+def _chunks(items, size):
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def compute_missing_hashes(batch_size=500):
+    """Hash the assets that have no content hash yet (see content.images); returns how many were hashed."""
+    hashed = 0
+    last_id = 0
+    assets = MediaAsset.objects.filter(content_hash='').only('id', 'url', 'content_hash').order_by('id')
+    while batch := list(assets.filter(id__gt=last_id)[:batch_size]):
+        last_id = batch[-1].id
+        for asset in batch:
+            asset.refresh_content_hash()
+        hashed_assets = [asset for asset in batch if asset.content_hash]
+        MediaAsset.objects.bulk_update(hashed_assets, ['content_hash'])
+        hashed += len(hashed_assets)
+    return hashed
+
+
+def find_duplicate(content_hash, exclude_public_id=None):
+    """Return the oldest asset with ``content_hash``, other than ``exclude_public_id``."""
+    if not content_hash:
+        return None
+    assets = MediaAsset.objects.filter(content_hash=content_hash).order_by('id')
+    if exclude_public_id is not None:
+        assets = assets.exclude(public_id=exclude_public_id)
+    return assets.first()
+
+
+def rewrite_image_references(replacements):
+    """
+    Point content at new image URLs, given ``{old_url: new_url}``.
+    One UPDATE per URL field; returns the number of rows changed.
+    """
+    changed = 0
+    for model, fields in IMAGE_FIELDS.items():
+        if model is MediaAsset:
+            continue
+        model_changed = 0
+        for field in fields:
+            if (model, field) in LIST_FIELDS:
+                for instance in model.objects.only('pk', field):
+                    urls = getattr(instance, field)
+                    rewritten = [replacements.get(url, url) if isinstance(url, str) else url for url in urls]
+                    if rewritten != urls:
+                        model.objects.filter(pk=instance.pk).update(**{field: rewritten})
+                        model_changed += 1
+                continue
+            # Chunked to stay under SQLite's bound-parameter limit
+            for chunk in _chunks(list(replacements.items()), 300):
+                model_changed += model.objects.filter(**{f'{field}__in': [old for old, _ in chunk]}).update(
+                    **{field: Case(
+                        *[When(**{field: old}, then=Value(new)) for old, new in chunk],
+                        output_field=model._meta.get_field(field),
+                    )}
+                )
+        if model_changed:
+            # update() sends no post_save
+            schedule_homepage_rebuild(sections_for_model(model))
+        changed += model_changed
+    return changed
+
+
+def merge_duplicate_assets(dry_run=False):
+    """
+    Collapse assets that share a content hash into the oldest of each group:
+    content pointing at a duplicate's URLs is rewritten to the keeper's, then
+    the duplicates are deleted. Returns ``(groups, removed, references)``.
+    """
+    groups = list(
+        MediaAsset.objects.exclude(content_hash='').values('content_hash')
+        .annotate(keep_id=Min('id'), copies=Count('id')).filter(copies__gt=1)
+        .values_list('content_hash', 'keep_id')
+    )
+    if not groups:
+        return 0, 0, 0
+
+    keepers = MediaAsset.objects.in_bulk([keep_id for _, keep_id in groups])
+    duplicates = MediaAsset.objects.filter(
+        content_hash__in=[content_hash for content_hash, _ in groups],
+    ).exclude(id__in=keepers)
+
+    replacements = {}
+    duplicate_ids = []
+    keeper_by_hash = {keeper.content_hash: keeper for keeper in keepers.values()}
+    for duplicate in duplicates:
+        keeper = keeper_by_hash[duplicate.content_hash]
+        duplicate_ids.append(duplicate.id)
+        for field in ('url', 'secure_url', 'web_url', 'thumbnail_url'):
+            old, new = getattr(duplicate, field), getattr(keeper, field) or keeper.url
+            if old and new and old != new:
+                replacements[old] = new
+
+    if dry_run:
+        return len(groups), len(duplicate_ids), 0
+    with transaction.atomic():
+        references = rewrite_image_references(replacements) if replacements else 0
+        MediaAsset.objects.filter(id__in=duplicate_ids).delete()
+    return len(groups), len(duplicate_ids), references
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0004_finalwordsection_background_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HomepageSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payload', models.BinaryField()),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Homepage Snapshot',
+                'verbose_name_plural': 'Homepage Snapshot',
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.2 on 2026-10-18 13:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0005_homepagesnapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishedSnapshot',
+            fields=[
+                ('version', models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ('payload', models.BinaryField()),
+                ('rolled_back_from', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('published_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Published Snapshot',
+                'verbose_name_plural': 'Published Snapshots',
+                'ordering': ['-version'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 13:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_publishedsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publishedsnapshot',
+            name='section_versions',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.2 on 2026-10-18 13:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_publishedsnapshot_section_versions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['sort_order', 'created_at', 'id'], name='content_faq_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mediaasset',
+            index=models.Index(fields=['-created_at', 'id'], name='content_media_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioproject',
+            index=models.Index(fields=['sort_order', 'created_at', 'id'], name='content_portfolio_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['sort_order', 'created_at', 'id'], name='content_service_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sociallink',
+            index=models.Index(fields=['sort_order', 'created_at', 'id'], name='content_sociallink_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stat',
+            index=models.Index(fields=['sort_order', 'created_at', 'id'], name='content_stat_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['sort_order', 'created_at', 'id'], name='content_testimonial_keyset_idx'),
+        ),
+    ]
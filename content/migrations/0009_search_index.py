@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_search_table(apps, schema_editor):
+    # FTS5 is SQLite-only; other databases run without search
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS content_search USING fts5("
+        "type UNINDEXED, object_id UNINDEXED, title, body, tokenize = 'porter unicode61')"
+    )
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS content_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 13:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0009_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mediaasset',
+            index=models.Index(fields=['folder', 'public_id'], name='content_media_folder_idx'),
+        ),
+    ]
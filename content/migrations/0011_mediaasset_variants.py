@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 13:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_mediaasset_folder_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaasset',
+            name='srcset',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='mediaasset',
+            name='variants',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 14:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0013_mediaasset_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='homepagesnapshot',
+            name='schema_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .images import file_content_hash, responsive_variants, srcset, url_content_hash
+
 
 # Single-instance models (one per site)
 class SEO(models.Model):
@@ -213,6 +216,9 @@ class Stat(models.Model):
         verbose_name = 'Stat'
         verbose_name_plural = 'Stats'
         ordering = ['sort_order', 'created_at']
+        indexes = [
+            models.Index(fields=['sort_order', 'created_at', 'id'], name='content_stat_keyset_idx'),
+        ]
 
     def __str__(self):
         return f"{self.value} - {self.label}"
@@ -266,6 +272,9 @@ class Service(models.Model):
         verbose_name = 'Service'
         verbose_name_plural = 'Services'
         ordering = ['sort_order', 'created_at']
+        indexes = [
+            models.Index(fields=['sort_order', 'created_at', 'id'], name='content_service_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -304,6 +313,9 @@ class PortfolioProject(models.Model):
         verbose_name = 'Portfolio Project'
         verbose_name_plural = 'Portfolio Projects'
         ordering = ['sort_order', 'created_at']
+        indexes = [
+            models.Index(fields=['sort_order', 'created_at', 'id'], name='content_portfolio_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -334,6 +346,13 @@ class MediaAsset(models.Model):
     web_url = models.URLField(blank=True, null=True)
     thumbnail_url = models.URLField(blank=True, null=True)
     folder = models.CharField(max_length=200, default='uploads')
+    # Width variants of ``url`` and the matching srcset, derived on save
+    variants = models.JSONField(default=list, blank=True)
+    srcset = models.TextField(blank=True, default='')
+    # Identifies the image for deduplication (see content.images): SHA-256 of
+    # the bytes of a local file or supplied by an import, else of the
+    # normalized URL; blank without a URL
+    content_hash = models.CharField(max_length=64, blank=True, default='', db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -341,10 +360,58 @@ class MediaAsset(models.Model):
         verbose_name = 'Media Asset'
         verbose_name_plural = 'Media Assets'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='content_media_keyset_idx'),
+            models.Index(fields=['folder', 'public_id'], name='content_media_folder_idx'),
+        ]
 
     def __str__(self):
         return self.public_id
 
+    def refresh_variants(self):
+        self.variants = responsive_variants(self.url or self.secure_url)
+        self.srcset = srcset(self.variants)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The URL the stored content_hash was computed for
+        instance._hashed_url = instance.__dict__.get('url')
+        return instance
+
+    def refresh_content_hash(self):
+        file_hash = file_content_hash(self.url)
+        if file_hash:
+            self.content_hash = file_hash
+        elif not self.url:
+            self.content_hash = ''
+        # Keep a hash supplied for this URL (an import's byte hash); a changed URL needs a new one
+        elif not self.content_hash or getattr(self, '_hashed_url', self.url) != self.url:
+            self.content_hash = url_content_hash(self.url)
+
+    def save(self, *args, **kwargs):
+        self.refresh_variants()
+        self.refresh_content_hash()
+        super().save(*args, **kwargs)
+        self._hashed_url = self.url
+
+
+class ImagePlaceholder(models.Model):
+    """Dimensions and a tiny blurred preview (LQIP) of a locally stored image, by URL"""
+    url = models.CharField(max_length=500, unique=True)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    lqip = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Image Placeholder'
+        verbose_name_plural = 'Image Placeholders'
+
+    def __str__(self):
+        return self.url
+
 
 class Testimonial(models.Model):
     name = models.CharField(max_length=100)
@@ -363,6 +430,9 @@ class Testimonial(models.Model):
         verbose_name = 'Testimonial'
         verbose_name_plural = 'Testimonials'
         ordering = ['sort_order', 'created_at']
+        indexes = [
+            models.Index(fields=['sort_order', 'created_at', 'id'], name='content_testimonial_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -379,6 +449,9 @@ class FAQ(models.Model):
         verbose_name = 'FAQ'
         verbose_name_plural = 'FAQs'
         ordering = ['sort_order', 'created_at']
+        indexes = [
+            models.Index(fields=['sort_order', 'created_at', 'id'], name='content_faq_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.question
@@ -396,6 +469,9 @@ class SocialLink(models.Model):
         verbose_name = 'Social Link'
         verbose_name_plural = 'Social Links'
         ordering = ['sort_order', 'created_at']
+        indexes = [
+            models.Index(fields=['sort_order', 'created_at', 'id'], name='content_sociallink_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.platform
@@ -462,3 +538,56 @@ class ContactFormField(models.Model):
     def __str__(self):
         return self.label
 
+
+
+# Precomputed content
+class HomepageSnapshot(models.Model):
+    """Serialized homepage payload, rebuilt whenever homepage content is written."""
+    payload = models.BinaryField()
+    version = models.PositiveIntegerField(default=0)
+    # content.homepage.HOMEPAGE_SCHEMA_VERSION the payload was built with
+    schema_version = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Homepage Snapshot'
+        verbose_name_plural = 'Homepage Snapshot'
+
+    def __str__(self):
+        return f"Homepage snapshot v{self.version}"
+
+    @property
+    def cache_key(self):
+        return f"draft:{self.version}"
+
+
+class PublishedSnapshot(models.Model):
+    """Immutable copy of the homepage payload as published to the public site."""
+    version = models.PositiveIntegerField(primary_key=True)
+    payload = models.BinaryField()
+    published_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL,
+        blank=True, null=True, related_name='+',
+    )
+    rolled_back_from = models.PositiveIntegerField(blank=True, null=True)
+    # Section name -> version in which that section last changed
+    section_versions = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Published Snapshot'
+        verbose_name_plural = 'Published Snapshots'
+        ordering = ['-version']
+
+    def __str__(self):
+        return f"Published homepage v{self.version}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Published snapshots are immutable; publish a new version instead.')
+        super().save(*args, **kwargs)
+
+    @property
+    def cache_key(self):
+        return f"published:{self.version}"
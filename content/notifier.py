@@ -0,0 +1,36 @@
+"""
+In-process change notifier for the homepage event stream.
+
+Snapshot rebuilds and publishes run in whichever thread handled the write,
+while event-stream connections wait on asyncio queues. ``notify`` hands each
+event to every subscribed queue on its own event loop. Other worker
+processes don't see these events; the stream covers them by polling the
+snapshot versions in the database (see content.views.homepage_events).
+"""
+import threading
+
+_lock = threading.Lock()
+_subscribers = set()
+
+
+def subscribe(loop, queue):
+    with _lock:
+        _subscribers.add((loop, queue))
+
+
+def unsubscribe(loop, queue):
+    with _lock:
+        _subscribers.discard((loop, queue))
+
+
+def notify(channel, version, sections):
+    """
+    Push ``{'channel', 'version', 'sections'}`` to every subscriber.
+    ``channel`` is 'draft' for saved content and 'published' for a new published version.
+    """
+    event = {'channel': channel, 'version': version, 'sections': sections}
+    with _lock:
+        subscribers = list(_subscribers)
+    for loop, queue in subscribers:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(queue.put_nowait, event)
@@ -0,0 +1,147 @@
+"""
+Keyset (cursor) pagination for the content list endpoints.
+
+Each page is one indexed range scan: the cursor holds the ordering values of
+the row at the edge of the previous page and the next page filters on
+``(a, b, c) > (x, y, z)`` spelled out as ``a > x OR (a = x AND b > y) ...``.
+Unlike offset paging the cost does not grow with the page number, and rows
+inserted or deleted between requests never shift items across pages.
+
+Views declare their key in ``ordering``; it must end in a unique field and
+have a matching composite index on the model.
+"""
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def keyset_filter(ordering, position, reverse=False):
+    """Return a Q matching rows strictly after ``position`` in ``ordering``."""
+    condition = Q()
+    equal = {}
+    for field, value in zip(ordering, position):
+        name = field.lstrip('-')
+        lookup = 'gt' if field.startswith('-') == reverse else 'lt'
+        condition |= Q(**equal, **{f'{name}__{lookup}': value})
+        equal[name] = value
+    # Redundant bound on the leading column so the database seeks into the
+    # index instead of scanning it from the start
+    leading = ordering[0].lstrip('-')
+    lookup = 'gte' if ordering[0].startswith('-') == reverse else 'lte'
+    return Q(**{f'{leading}__{lookup}': position[0]}) & condition
+
+
+def reverse_ordering(ordering):
+    return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = list(view.ordering)
+        size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        if reverse:
+            queryset = queryset.order_by(*reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = queryset.filter(keyset_filter(self.ordering, position, reverse))
+
+        rows = list(queryset[:size + 1])
+        has_more = len(rows) > size
+        rows = rows[:size]
+        if reverse:
+            rows.reverse()
+
+        first = self.position(rows[0]) if rows else position
+        last = self.position(rows[-1]) if rows else position
+        if reverse:
+            self.previous = (first, True) if has_more else None
+            self.next = (last, False) if last is not None else None
+        else:
+            self.next = (last, False) if has_more else None
+            self.previous = (first, True) if position is not None else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_link(self.next),
+            'previous': self.get_link(self.previous),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def position(self, obj):
+        return [_encode_value(getattr(obj, field.lstrip('-'))) for field in self.ordering]
+
+    def decode_cursor(self, request, model):
+        """
+        Return ``(position, reverse)`` from the cursor parameter, with each
+        value converted by its model field, or raise NotFound for a cursor
+        this view could not have issued.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            position, reverse = cursor['p'], bool(cursor.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if None in position:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_link(self, cursor):
+        if cursor is None:
+            return None
+        position, reverse = cursor
+        position = [_encode_value(value) for value in position]
+        data = {'p': position, 'r': 1} if reverse else {'p': position}
+        encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, encoded)
@@ -0,0 +1,142 @@
+"""
+Low-quality image placeholders (LQIP) for locally stored images.
+
+For every image under MEDIA_URL that the media library or the homepage
+content points at, ``ImagePlaceholder`` keeps its dimensions and a tiny JPEG
+data URI. The homepage payload embeds both next to each image URL, so the
+frontend can reserve the right box and paint a blurred preview before the
+full image arrives.
+
+Decoding images is CPU-bound, so placeholders are made in a process pool:
+in bulk by ``manage.py generate_placeholders``, and for newly referenced
+images after a save (IMAGE_PLACEHOLDERS_ON_SAVE).
+"""
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .homepage import sections_for_model
+from .images import local_image_path, make_placeholder
+from .media import IMAGE_FIELDS
+from .models import ImagePlaceholder
+from .snapshot import schedule_homepage_rebuild
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _urls(values):
+    for value in values:
+        if isinstance(value, list):
+            yield from (item for item in value if isinstance(item, str) and item)
+        elif value:
+            yield value
+
+
+def instance_image_urls(instance):
+    fields = IMAGE_FIELDS.get(type(instance), ())
+    return set(_urls(getattr(instance, field) for field in fields))
+
+
+def referenced_image_urls():
+    """Every image URL held by the media library and the homepage content."""
+    urls = set()
+    for model, fields in IMAGE_FIELDS.items():
+        for row in model.objects.values_list(*fields).iterator(chunk_size=2000):
+            urls.update(_urls(row))
+    return urls
+
+
+def _missing(urls):
+    known = set()
+    urls = list(urls)
+    # Chunked to stay under SQLite's bound-parameter limit
+    for start in range(0, len(urls), 500):
+        known.update(
+            ImagePlaceholder.objects.filter(url__in=urls[start:start + 500]).values_list('url', flat=True)
+        )
+    return [url for url in urls if url not in known]
+
+
+def store_placeholders(placeholders):
+    """Save ``{url: {width, height, lqip}}`` and refresh the homepage sections that embed them."""
+    if not placeholders:
+        return
+    now = timezone.now()
+    ImagePlaceholder.objects.bulk_create(
+        [ImagePlaceholder(url=url, updated_at=now, **data) for url, data in placeholders.items()],
+        update_conflicts=True, unique_fields=['url'], update_fields=['width', 'height', 'lqip', 'updated_at'],
+    )
+    # bulk_create sends no post_save
+    schedule_homepage_rebuild(sections_for_model(ImagePlaceholder))
+
+
+def generate_placeholders(urls, workers=None, force=False, batch_size=500):
+    """
+    Make placeholders for the local images among ``urls`` in a process pool;
+    unless ``force``, skip the ones that already have one. Returns
+    ``(generated, failed)`` counts.
+    """
+    if not force:
+        urls = _missing(urls)
+    paths = {url: path for url in urls if (path := local_image_path(url))}
+    generated = failed = 0
+    batch = {}
+    size = settings.IMAGE_PLACEHOLDER_SIZE
+    with ProcessPoolExecutor(max_workers=workers or settings.IMAGE_PLACEHOLDER_WORKERS) as pool:
+        results = pool.map(partial(make_placeholder, size=size), map(str, paths.values()), chunksize=16)
+        for url, placeholder in zip(paths, results):
+            if placeholder is None:
+                failed += 1
+                continue
+            batch[url] = placeholder
+            if len(batch) >= batch_size:
+                store_placeholders(batch)
+                generated += len(batch)
+                batch = {}
+    store_placeholders(batch)
+    return generated + len(batch), failed
+
+
+def _background_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Forking a threaded web server process can deadlock the children
+            # on locks held by other threads; start them fresh instead
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_PLACEHOLDER_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _pool
+
+
+def _store_background_result(url, future):
+    # Runs on the pool's result thread, outside any request
+    try:
+        placeholder = future.result()
+        if placeholder is not None:
+            store_placeholders({url: placeholder})
+    except Exception:
+        logger.exception('Placeholder generation failed for %s', url)
+    finally:
+        close_old_connections()
+
+
+def generate_placeholders_in_background(urls):
+    """Queue placeholders for the local images among ``urls`` that have none yet; returns at once."""
+    pending = {url: path for url in _missing(urls) if (path := local_image_path(url))}
+    if not pending:
+        return
+    pool = _background_pool()
+    for url, path in pending.items():
+        future = pool.submit(make_placeholder, str(path), settings.IMAGE_PLACEHOLDER_SIZE)
+        future.add_done_callback(partial(_store_background_result, url))
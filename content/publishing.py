@@ -0,0 +1,152 @@
+"""
+Draft/published workflow for the homepage.
+
+Dashboard edits write to the live content tables, which act as the draft;
+content.snapshot keeps a rendered draft snapshot of them. The public API
+only ever serves ``PublishedSnapshot`` rows. Publishing freezes the current
+draft payload into a new, immutable version, and rolling back publishes an
+older version's payload again, so every version stays available.
+
+Published versions double as the public content version: each one records
+the version in which every section last changed, which is what the delta
+sync endpoint (/api/homepage/changes/) answers from.
+"""
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.dispatch import Signal
+from rest_framework.renderers import JSONRenderer
+
+from .models import HomepageSnapshot, PublishedSnapshot
+from .homepage import HOMEPAGE_SCHEMA_VERSION
+from .snapshot import get_encoded_payload, get_encoded_snapshot, rebuild_homepage_snapshot
+
+PUBLISHED_CACHE_KEY = 'content:homepage:published'
+PUBLISH_ATTEMPTS = 5
+CHANGES_CACHE_KEY = 'content:homepage:{}'
+
+# Sent after a new version is published (including rollbacks), with ``snapshot``
+homepage_published = Signal()
+
+
+def _cache_published(snapshot):
+    # Postgres hands BinaryField values back as memoryview, which can't be pickled
+    snapshot.payload = bytes(snapshot.payload)
+    cache.set(PUBLISHED_CACHE_KEY, snapshot, settings.HOMEPAGE_CACHE_TIMEOUT)
+    return snapshot
+
+
+def _published(snapshot):
+    _cache_published(snapshot)
+    # Compress once per published version, on the write path
+    get_encoded_snapshot(snapshot)
+    homepage_published.send(sender=PublishedSnapshot, snapshot=snapshot)
+
+
+def _section_versions(data, version, previous):
+    """Carry over each unchanged section's version from ``previous``."""
+    if previous is None:
+        return {name: version for name in data}
+    previous_data = json.loads(bytes(previous.payload))
+    return {
+        name: (
+            previous.section_versions.get(name, previous.version)
+            if name in previous_data and previous_data[name] == value
+            else version
+        )
+        for name, value in data.items()
+    }
+
+
+def _publish_payload(payload, user=None, rolled_back_from=None):
+    # The version is the primary key. select_for_update() locks nothing on an
+    # empty table, or at all on SQLite, so a concurrent publish can take the
+    # same version first; retry on top of it
+    for attempt in range(PUBLISH_ATTEMPTS):
+        try:
+            with transaction.atomic():
+                latest = PublishedSnapshot.objects.select_for_update().first()
+                version = latest.version + 1 if latest else 1
+                snapshot = PublishedSnapshot.objects.create(
+                    version=version,
+                    payload=bytes(payload),
+                    # user may be a token user rather than a User instance
+                    published_by_id=user.pk if user else None,
+                    rolled_back_from=rolled_back_from,
+                    section_versions=_section_versions(json.loads(payload), version, latest),
+                )
+                transaction.on_commit(lambda: _published(snapshot))
+            return snapshot
+        except IntegrityError:
+            if attempt == PUBLISH_ATTEMPTS - 1:
+                raise
+
+
+def publish_homepage(user=None):
+    """Freeze the current draft snapshot into a new published version."""
+    draft = HomepageSnapshot.objects.first()
+    if draft is None or draft.schema_version != HOMEPAGE_SCHEMA_VERSION:
+        draft = rebuild_homepage_snapshot()
+    return _publish_payload(draft.payload, user=user)
+
+
+def rollback_homepage(version, user=None):
+    """Publish the payload of an earlier version again, as a new version."""
+    source = PublishedSnapshot.objects.get(pk=version)
+    return _publish_payload(source.payload, user=user, rolled_back_from=version)
+
+
+def get_published_snapshot():
+    """
+    Return the latest published snapshot, or None if nothing has been
+    published yet. Reads never publish: the first version is published by
+    an editor or ``manage.py rebuild_homepage --publish``.
+    """
+    snapshot = cache.get(PUBLISHED_CACHE_KEY)
+    if snapshot is not None:
+        return snapshot
+    snapshot = PublishedSnapshot.objects.first()
+    if snapshot is None:
+        return None
+    return _cache_published(snapshot)
+
+
+def get_homepage_changes(since):
+    """
+    Return ``(payload, variants)`` describing what changed after version ``since``.
+
+    The payload holds the current ``version`` and the data of every section
+    that changed after ``since``. When the client is too far behind
+    (``HOMEPAGE_CHANGES_MAX_LAG`` versions), has no version, or claims one
+    newer than the current, ``full`` is true and every section is included.
+    Full responses don't depend on ``since``, so they share one cache entry.
+    Returns None if nothing has been published yet.
+    """
+    snapshot = get_published_snapshot()
+    if snapshot is None:
+        return None
+    full = (
+        since is None or since > snapshot.version
+        or snapshot.version - since > settings.HOMEPAGE_CHANGES_MAX_LAG
+    )
+    key = f"changes:{snapshot.version}:{'full' if full else since}"
+    payload = cache.get(CHANGES_CACHE_KEY.format(key))
+    if payload is None:
+        data = json.loads(snapshot.payload)
+        if full:
+            sections = data
+        else:
+            sections = {
+                name: value for name, value in data.items()
+                if snapshot.section_versions.get(name, snapshot.version) > since
+            }
+        payload = JSONRenderer().render({
+            'version': snapshot.version,
+            'since': None if full else since,
+            'full': full,
+            'sections': sections,
+        })
+        cache.set(CHANGES_CACHE_KEY.format(key), payload, settings.HOMEPAGE_CACHE_TIMEOUT)
+    return payload, get_encoded_payload(key, payload)
@@ -0,0 +1,65 @@
+"""
+Drag-and-drop reordering of ``sort_order`` collections.
+
+A reorder is one validating SELECT and one ``UPDATE ... SET sort_order =
+CASE id WHEN ... END`` inside a transaction. ``QuerySet.update()`` sends no
+model signals, so the homepage sections that read the collection are
+scheduled for a single rebuild explicitly.
+"""
+from django.db import transaction
+from django.db.models import Case, IntegerField, Subquery, Value, When
+from django.utils import timezone
+
+from .homepage import sections_for_model
+from .models import (
+    Stat, BrutalMathStat, WhyCentauraFeature, Service, ComparisonTableFeature,
+    PortfolioProject, ProcessStep, Testimonial, FAQ, SocialLink
+)
+from .snapshot import schedule_homepage_rebuild
+
+
+# URL name -> (model, field scoping the collection or None)
+REORDERABLE_COLLECTIONS = {
+    'stats': (Stat, None),
+    'brutal-math-stats': (BrutalMathStat, None),
+    'why-centaura-features': (WhyCentauraFeature, None),
+    'services': (Service, None),
+    'comparison-table-features': (ComparisonTableFeature, 'comparison_table'),
+    'portfolio': (PortfolioProject, None),
+    'process-steps': (ProcessStep, 'process_section'),
+    'testimonials': (Testimonial, None),
+    'faqs': (FAQ, None),
+    'social-links': (SocialLink, None),
+}
+
+
+class ReorderError(ValueError):
+    pass
+
+
+def reorder_collection(collection, ids):
+    """
+    Set ``sort_order`` to each row's position in ``ids``. ``ids`` must list
+    every row of the collection (of one parent, for scoped collections)
+    exactly once.
+    """
+    model, scope = REORDERABLE_COLLECTIONS[collection]
+    if not ids or len(set(ids)) != len(ids):
+        raise ReorderError('ids must be a non-empty list without duplicates')
+
+    with transaction.atomic():
+        rows = model.objects.select_for_update()
+        if scope:
+            parent = model.objects.filter(pk=ids[0]).values(f'{scope}_id')[:1]
+            rows = rows.filter(**{f'{scope}_id': Subquery(parent)})
+        if set(rows.order_by().values_list('pk', flat=True)) != set(ids):
+            raise ReorderError('ids must list every item of the collection exactly once')
+
+        model.objects.filter(pk__in=ids).update(
+            sort_order=Case(
+                *[When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)],
+                output_field=IntegerField(),
+            ),
+            updated_at=timezone.now(),
+        )
+        schedule_homepage_rebuild(sections_for_model(model))
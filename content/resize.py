@@ -0,0 +1,165 @@
+"""
+Resized copies of locally stored images, served by /api/images/.
+
+An encoded variant is stored on disk under a key hashed from the source
+file's identity (path, size, modification time) and the requested width and
+format. A changed source therefore gets a new key, and a stored variant never
+changes, which lets responses be cached as immutable.
+
+The cache is bounded by IMAGE_CACHE_MAX_BYTES. Reads refresh a file's
+modification time, and when the total goes over the limit the least
+recently used files are deleted. Concurrent requests in one process for the
+same missing variant wait for a single encode; across processes, files are
+written atomically, so a duplicate encode only costs time.
+"""
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import Future
+
+from django.conf import settings
+
+from .export import write_atomic
+
+# Bump to invalidate every cached variant after changing how they are encoded
+ENCODER_VERSION = 1
+
+# Requested format -> (Pillow format, content type)
+FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+    'png': ('PNG', 'image/png'),
+}
+
+
+class ResizeError(ValueError):
+    pass
+
+
+def variant_key(path, width, image_format):
+    stat = os.stat(path)
+    identity = f'{ENCODER_VERSION}:{path}:{stat.st_size}:{stat.st_mtime_ns}:{width}:{image_format}'
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def encode_variant(path, width, image_format):
+    """Return ``path`` scaled to ``width`` (never enlarged) and encoded as ``image_format``."""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    pillow_format = FORMATS[image_format][0]
+    try:
+        with Image.open(path) as image:
+            # Let the JPEG decoder downscale while decoding instead of after
+            image.draft('RGB', (width, width))
+            image = ImageOps.exif_transpose(image)
+            if image.width > width:
+                image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+            if pillow_format == 'JPEG' and image.mode != 'RGB':
+                image = image.convert('RGB')
+            elif image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                image = image.convert('RGBA')
+            buffer = io.BytesIO()
+            image.save(buffer, pillow_format, quality=settings.IMAGE_RESIZE_QUALITY, optimize=True)
+    except (OSError, UnidentifiedImageError) as exc:
+        raise ResizeError(f'Cannot resize {path.name}: {exc}')
+    return buffer.getvalue()
+
+
+class VariantCache:
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._inflight = {}
+        # Bytes on disk; counted lazily and re-counted on every eviction, so
+        # writes by other processes are picked up then
+        self._total = None
+
+    def _path(self, key, image_format):
+        return os.path.join(self.root, key[:2], f'{key}.{image_format}')
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process since it was read; the bytes are still good
+            pass
+        return data
+
+    def _files(self):
+        if not os.path.isdir(self.root):
+            return []
+        files = []
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                # Skip write_atomic's temp files
+                if entry.is_file() and not entry.name.startswith('.'):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _evict(self):
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        # Evict down to 90% so the next few writes don't each trigger a scan
+        target = self.max_bytes * 0.9
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total = total
+
+    def _store(self, key, image_format, data):
+        write_atomic(self._path(key, image_format), data)
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._files())
+            else:
+                self._total += len(data)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def get_or_create(self, key, image_format, encode):
+        """Return the cached bytes for ``key``, calling ``encode()`` once to make them if missing."""
+        path = self._path(key, image_format)
+        data = self._read(path)
+        if data is not None:
+            return data
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            data = self._read(path)
+            if data is None:
+                data = encode()
+                self._store(key, image_format, data)
+            future.set_result(data)
+            return data
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+variant_cache = VariantCache(settings.IMAGE_CACHE_ROOT, settings.IMAGE_CACHE_MAX_BYTES)
@@ -0,0 +1,100 @@
+"""
+Read-only serialization from ``values_list()`` tuples.
+
+``RowSerializer`` inspects a ModelSerializer's fields once and keeps, for
+each output field, the model column it reads and how to convert the raw
+value. Text, integer, boolean, JSON and primary-key fields are already in
+their serialized form when they come out of the database, so only datetimes
+(and any field type it does not know) are converted per row. The output is
+identical to ``serializer_class(instances, many=True).data``.
+"""
+from functools import lru_cache, partial
+
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+# to_representation methods that return database values unchanged
+_IDENTITY_REPRESENTATIONS = {
+    serializers.CharField.to_representation,
+    serializers.IntegerField.to_representation,
+    serializers.BooleanField.to_representation,
+    serializers.JSONField.to_representation,
+    serializers.PrimaryKeyRelatedField.to_representation,
+}
+
+
+def _datetime_to_representation(field, tz, value):
+    # DateTimeField.to_representation without the per-call settings lookups
+    if value.tzinfo is None:
+        return field.to_representation(value)
+    value = value.astimezone(tz).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+class RowSerializer:
+    def __init__(self, serializer_class, names):
+        fields = serializer_class().fields
+        model_fields = {field.name: field for field in serializer_class.Meta.model._meta.concrete_fields}
+        self.names = names
+        self.columns = []
+        self._converters = []
+        self._datetimes = []
+        self.supported = True
+        for position, name in enumerate(names):
+            field = fields[name]
+            model_field = model_fields.get(field.source)
+            if model_field is None or getattr(field, 'binary', False):
+                self.supported = False
+                return
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is not None:
+                self.supported = False
+                return
+            self.columns.append(model_field.attname)
+
+            if type(field).to_representation in _IDENTITY_REPRESENTATIONS:
+                continue
+            if (
+                type(field).to_representation is serializers.DateTimeField.to_representation
+                and getattr(field, 'format', api_settings.DATETIME_FORMAT) == ISO_8601
+                and not hasattr(field, 'timezone')
+            ):
+                self._datetimes.append((position, name, field))
+            else:
+                self._converters.append((position, name, field.to_representation))
+
+    def serialize(self, rows):
+        """Return a list of dicts for ``values_list(*self.columns, ...)`` rows."""
+        tz = timezone.get_current_timezone()
+        converters = self._converters + [
+            (position, name, partial(_datetime_to_representation, field, tz))
+            for position, name, field in self._datetimes
+        ]
+        names = self.names
+        data = []
+        for row in rows:
+            item = dict(zip(names, row))
+            for position, name, convert in converters:
+                value = row[position]
+                if value is not None:
+                    item[name] = convert(value)
+            data.append(item)
+        return data
+
+
+@lru_cache(maxsize=None)
+def serializer_field_names(serializer_class):
+    return tuple(serializer_class().fields)
+
+
+@lru_cache(maxsize=None)
+def row_serializer_for(serializer_class, names):
+    """
+    Return the RowSerializer rendering ``names`` of ``serializer_class``, or
+    None when one of those fields does not map to a plain model column.
+    """
+    row_serializer = RowSerializer(serializer_class, names)
+    return row_serializer if row_serializer.supported else None
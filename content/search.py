@@ -0,0 +1,177 @@
+"""
+Full-text search over site content, backed by an SQLite FTS5 table.
+
+``content_search`` holds one document per searchable object: a title and a
+body, keyed by document type and object id. Documents are rewritten from
+post_save/post_delete (see ``signals.py``) and by the bulk endpoints, so the
+index is updated in the same transaction as the content.
+``manage.py rebuild_search_index`` fills it from scratch.
+
+FTS5 ships with SQLite; on any other database search is unavailable.
+"""
+import html
+import re
+
+from django.db import connection
+
+from .models import FAQ, Testimonial, Service, PortfolioProject, PeopleBehindStrategy
+
+
+SEARCH_TABLE = 'content_search'
+
+# bm25 weights for the (type, object_id, title, body) columns
+_TITLE_WEIGHT = 5.0
+_BODY_WEIGHT = 1.0
+
+# highlight()/snippet() wrap matches in these private-use characters rather
+# than in tags, so the text can be HTML-escaped before the tags go in. They
+# are stripped from documents so content can't forge a match.
+_MATCH_START = '\ue000'
+_MATCH_END = '\ue001'
+_STRIP_MARKERS = {ord(_MATCH_START): None, ord(_MATCH_END): None}
+
+
+def _text(*parts):
+    return '\n'.join(str(part) for part in parts if part)
+
+
+def _bio(bio):
+    return _text(*bio) if isinstance(bio, list) else _text(bio)
+
+
+def faq_documents(faq):
+    return {'faq': (faq.question, faq.answer)}
+
+
+def testimonial_documents(testimonial):
+    return {'testimonial': (_text(testimonial.name, testimonial.role), testimonial.content)}
+
+
+def service_documents(service):
+    return {'service': (service.title, _text(service.label, service.description, service.outcome))}
+
+
+def portfolio_documents(project):
+    if not project.is_active:
+        return {}
+    return {'portfolio': (project.title, _text(project.category, project.description))}
+
+
+def people_documents(people):
+    return {
+        'person.jane': (_text(people.jane_name, people.jane_title), _bio(people.jane_bio)),
+        'person.aimun': (_text(people.aimun_name, people.aimun_title), _bio(people.aimun_bio)),
+    }
+
+
+# Model -> (document types it owns, function returning {type: (title, body)})
+SEARCH_MODELS = {
+    FAQ: (('faq',), faq_documents),
+    Testimonial: (('testimonial',), testimonial_documents),
+    Service: (('service',), service_documents),
+    PortfolioProject: (('portfolio',), portfolio_documents),
+    PeopleBehindStrategy: (('person.jane', 'person.aimun'), people_documents),
+}
+
+
+def search_available():
+    return connection.vendor == 'sqlite'
+
+
+def _delete(cursor, types, ids):
+    placeholders = ', '.join(['%s'] * len(ids))
+    for document_type in types:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE type = %s AND object_id IN ({placeholders})',
+            [document_type, *ids],
+        )
+
+
+def index_objects(model, instances):
+    """Replace the search documents of ``instances``."""
+    if not search_available() or not instances:
+        return
+    types, documents = SEARCH_MODELS[model]
+    rows = [
+        (document_type, instance.pk, (title or '').translate(_STRIP_MARKERS), (body or '').translate(_STRIP_MARKERS))
+        for instance in instances
+        for document_type, (title, body) in documents(instance).items()
+    ]
+    with connection.cursor() as cursor:
+        _delete(cursor, types, [instance.pk for instance in instances])
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (type, object_id, title, body) VALUES (%s, %s, %s, %s)', rows,
+        )
+
+
+def remove_objects(model, ids):
+    """Drop the search documents of the objects with primary keys ``ids``."""
+    if not search_available() or not ids:
+        return
+    with connection.cursor() as cursor:
+        _delete(cursor, SEARCH_MODELS[model][0], list(ids))
+
+
+def rebuild_search_index():
+    """Reindex every searchable object; returns the number of objects indexed."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+    total = 0
+    for model in SEARCH_MODELS:
+        instances = list(model.objects.all())
+        index_objects(model, instances)
+        total += len(instances)
+    return total
+
+
+def match_expression(query):
+    """
+    Turn free text into an FTS5 query: every word must match, the last one
+    as a prefix. Words are quoted so FTS5 operators in the input are inert.
+    """
+    words = re.findall(r'\w+', query)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _highlighted(text):
+    """HTML-escape FTS5 output and turn its match markers into ``<mark>`` tags."""
+    return html.escape(text).replace(_MATCH_START, '<mark>').replace(_MATCH_END, '</mark>')
+
+
+def search(query, limit=20):
+    """
+    Return ranked hits for ``query``, best first. ``title`` and ``snippet``
+    are HTML: the content is escaped and the matches wrapped in ``<mark>``.
+    """
+    expression = match_expression(query)
+    if expression is None:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT type, object_id,
+                   highlight({SEARCH_TABLE}, 2, %s, %s),
+                   snippet({SEARCH_TABLE}, 3, %s, %s, '…', 16),
+                   bm25({SEARCH_TABLE}, 0, 0, %s, %s) AS rank
+            FROM {SEARCH_TABLE}
+            WHERE {SEARCH_TABLE} MATCH %s
+            ORDER BY rank
+            LIMIT %s
+            """,
+            [
+                _MATCH_START, _MATCH_END, _MATCH_START, _MATCH_END,
+                _TITLE_WEIGHT, _BODY_WEIGHT, expression, limit,
+            ],
+        )
+        return [
+            {
+                'type': document_type, 'id': object_id,
+                'title': _highlighted(title), 'snippet': _highlighted(snippet),
+                'score': round(-rank, 4),
+            }
+            for document_type, object_id, title, snippet, rank in cursor.fetchall()
+        ]
@@ -5,69 +5,109 @@ from .models import (
 )
 
 
-class SEOSerializer(serializers.ModelSerializer):
+def _field_names(request, param):
+    value = request.query_params.get(param)
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def sparse_fieldset(request, available):
+    """
+    Return the field names a GET request selected with ``?fields=a,b`` and/or
+    ``?omit=c``, in declaration order, or None if it asked for everything.
+    """
+    if request is None or request.method != 'GET':
+        return None
+    fields = _field_names(request, 'fields')
+    omit = _field_names(request, 'omit')
+    if fields is None and omit is None:
+        return None
+
+    unknown = set(fields or ()).union(omit or ()).difference(available)
+    if unknown:
+        raise serializers.ValidationError({'fields': [f'Unknown field: {name}' for name in sorted(unknown)]})
+    return [
+        name for name in available
+        if (fields is None or name in fields) and name not in (omit or ())
+    ]
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """ModelSerializer that only renders the fields selected by ``?fields=`` / ``?omit=``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = sparse_fieldset(self.context.get('request'), list(self.fields))
+        if selected is not None:
+            for name in set(self.fields).difference(selected):
+                self.fields.pop(name)
+
+
+class SEOSerializer(SparseFieldsetSerializer):
     class Meta:
         model = SEO
         fields = '__all__'
 
 
-class NavigationSerializer(serializers.ModelSerializer):
+class NavigationSerializer(SparseFieldsetSerializer):
     class Meta:
         model = Navigation
         fields = '__all__'
 
 
-class HeroSerializer(serializers.ModelSerializer):
+class HeroSerializer(SparseFieldsetSerializer):
     class Meta:
         model = Hero
         fields = '__all__'
 
 
-class StatSerializer(serializers.ModelSerializer):
+class StatSerializer(SparseFieldsetSerializer):
     class Meta:
         model = Stat
         fields = '__all__'
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(SparseFieldsetSerializer):
     class Meta:
         model = Service
         fields = '__all__'
 
 
-class PortfolioProjectSerializer(serializers.ModelSerializer):
+class PortfolioProjectSerializer(SparseFieldsetSerializer):
     class Meta:
         model = PortfolioProject
         fields = '__all__'
 
 
-class TestimonialSerializer(serializers.ModelSerializer):
+class TestimonialSerializer(SparseFieldsetSerializer):
     class Meta:
         model = Testimonial
         fields = '__all__'
 
 
-class FAQSerializer(serializers.ModelSerializer):
+class FAQSerializer(SparseFieldsetSerializer):
     class Meta:
         model = FAQ
         fields = '__all__'
 
 
-class FooterSerializer(serializers.ModelSerializer):
+class FooterSerializer(SparseFieldsetSerializer):
     class Meta:
         model = Footer
         fields = '__all__'
 
 
-class SocialLinkSerializer(serializers.ModelSerializer):
+class SocialLinkSerializer(SparseFieldsetSerializer):
     class Meta:
         model = SocialLink
         fields = '__all__'
 
 
-class MediaAssetSerializer(serializers.ModelSerializer):
+class MediaAssetSerializer(SparseFieldsetSerializer):
     class Meta:
         model = MediaAsset
         fields = '__all__'
+        read_only_fields = ['variants', 'srcset', 'content_hash']
 
 
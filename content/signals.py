@@ -0,0 +1,89 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import notifier
+from .export import export_homepage
+from .homepage import SECTION_MODELS, sections_for_model
+from .media import IMAGE_FIELDS
+from .placeholders import generate_placeholders_in_background, instance_image_urls
+from .publishing import homepage_published
+from .search import SEARCH_MODELS, index_objects, remove_objects
+from .snapshot import homepage_snapshot_rebuilt, schedule_homepage_rebuild
+
+
+def homepage_content_changed(sender, **kwargs):
+    """Rebuild only the homepage sections that read from the written model"""
+    schedule_homepage_rebuild(sections_for_model(sender))
+
+
+for model in {model for models in SECTION_MODELS.values() for model in models}:
+    post_save.connect(
+        homepage_content_changed, sender=model,
+        dispatch_uid=f'homepage_snapshot_save_{model.__name__}',
+    )
+    post_delete.connect(
+        homepage_content_changed, sender=model,
+        dispatch_uid=f'homepage_snapshot_delete_{model.__name__}',
+    )
+
+
+def search_content_saved(sender, instance, **kwargs):
+    """Rewrite the object's search documents in the same transaction as the save"""
+    index_objects(sender, [instance])
+
+
+def search_content_deleted(sender, instance, **kwargs):
+    remove_objects(sender, [instance.pk])
+
+
+for model in SEARCH_MODELS:
+    post_save.connect(
+        search_content_saved, sender=model,
+        dispatch_uid=f'search_index_save_{model.__name__}',
+    )
+    post_delete.connect(
+        search_content_deleted, sender=model,
+        dispatch_uid=f'search_index_delete_{model.__name__}',
+    )
+
+
+def image_content_saved(sender, instance, **kwargs):
+    """Queue placeholders for local images the saved object newly references, after commit"""
+    if settings.IMAGE_PLACEHOLDERS_ON_SAVE:
+        urls = instance_image_urls(instance)
+        if urls:
+            transaction.on_commit(partial(generate_placeholders_in_background, urls))
+
+
+for model in IMAGE_FIELDS:
+    post_save.connect(
+        image_content_saved, sender=model,
+        dispatch_uid=f'image_placeholders_save_{model.__name__}',
+    )
+
+
+@receiver(homepage_published, dispatch_uid='homepage_static_export')
+def export_published_homepage(sender, snapshot, **kwargs):
+    """Refresh the static export after every publish when HOMEPAGE_EXPORT_PATH is set"""
+    if settings.HOMEPAGE_EXPORT_PATH:
+        export_homepage(snapshot=snapshot)
+
+
+@receiver(homepage_snapshot_rebuilt, dispatch_uid='homepage_events_draft')
+def notify_draft_changed(sender, snapshot, sections, **kwargs):
+    """Tell event-stream clients in this process which draft sections changed"""
+    notifier.notify('draft', snapshot.version, sections)
+
+
+@receiver(homepage_published, dispatch_uid='homepage_events_published')
+def notify_published(sender, snapshot, **kwargs):
+    """Tell event-stream clients in this process which sections a publish changed"""
+    sections = [
+        name for name, version in snapshot.section_versions.items()
+        if version == snapshot.version
+    ]
+    notifier.notify('published', snapshot.version, sections)
@@ -0,0 +1,188 @@
+"""
+Precomputed homepage snapshot.
+
+The homepage payload is rendered to JSON bytes once, when content is written,
+and stored in ``HomepageSnapshot``. This is the draft: editors preview it, and
+publishing (see content.publishing) freezes it into a ``PublishedSnapshot``
+for the public site. Both are served from the cache as ready-made bytes, so a
+request does not touch the ORM at all.
+
+Each section of the payload also has its own cache entry. A write only
+rebuilds the sections whose models changed; the rest of the snapshot is
+carried over from the stored payload, unless it was built under another
+``HOMEPAGE_SCHEMA_VERSION``, in which case every section is rebuilt.
+"""
+import asyncio
+import json
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.dispatch import Signal
+from rest_framework.renderers import JSONRenderer
+
+from .compression import compress_payload
+from .homepage import HOMEPAGE_SCHEMA_VERSION, HOMEPAGE_SECTIONS, build_section, build_sections
+from .models import HomepageSnapshot
+
+SNAPSHOT_CACHE_KEY = 'content:homepage:snapshot'
+SECTION_CACHE_KEY = 'content:homepage:section:{}:{}'
+SUBSET_CACHE_KEY = 'content:homepage:subset:{}'
+ENCODED_CACHE_KEY = 'content:homepage:encoded:{}'
+
+# Sent after a rebuilt snapshot is stored, with ``snapshot`` and ``sections``
+homepage_snapshot_rebuilt = Signal()
+
+_pending = threading.local()
+
+
+def _cache_snapshot(snapshot):
+    # Postgres hands BinaryField values back as memoryview, which can't be pickled
+    snapshot.payload = bytes(snapshot.payload)
+    cache.set(SNAPSHOT_CACHE_KEY, snapshot, settings.HOMEPAGE_CACHE_TIMEOUT)
+    return snapshot
+
+
+def _build_section_in_thread(name):
+    try:
+        return build_section(name)
+    finally:
+        # Executor threads live outside the request cycle, so apply the same
+        # CONN_MAX_AGE rules Django applies at the end of a request
+        close_old_connections()
+
+
+async def aget_homepage_sections(names):
+    """
+    Return ``{name: data}`` for the named sections.
+    Cached sections are read in one round trip; the rest are built
+    concurrently, each in its own thread with its own DB connection, so a
+    cold load takes about as long as the slowest section.
+    """
+    keys = {name: SECTION_CACHE_KEY.format(HOMEPAGE_SCHEMA_VERSION, name) for name in names}
+    cached = await cache.aget_many(keys.values())
+    data = {name: cached[key] for name, key in keys.items() if key in cached}
+
+    missing = [name for name in names if name not in data]
+    built = await asyncio.gather(*(
+        sync_to_async(_build_section_in_thread, thread_sensitive=False)(name)
+        for name in missing
+    ))
+    if missing:
+        await cache.aset_many(
+            {keys[name]: section for name, section in zip(missing, built)},
+            settings.HOMEPAGE_CACHE_TIMEOUT,
+        )
+    data.update(zip(missing, built))
+    return {name: data[name] for name in names}
+
+
+def rebuild_homepage_sections(names):
+    """
+    Rebuild the given sections and splice them into the stored snapshot.
+    Sections not listed keep the data already in the snapshot payload, as
+    long as it was built under the current schema version.
+    """
+    with transaction.atomic():
+        snapshot = HomepageSnapshot.objects.select_for_update().first()
+        if snapshot is None:
+            snapshot = HomepageSnapshot()
+            names = HOMEPAGE_SECTIONS
+            data = {}
+        elif snapshot.schema_version != HOMEPAGE_SCHEMA_VERSION:
+            names = HOMEPAGE_SECTIONS
+            data = {}
+        else:
+            data = json.loads(bytes(snapshot.payload))
+
+        built = build_sections([name for name in HOMEPAGE_SECTIONS if name in names or name not in data])
+        data.update(built)
+        cache.set_many(
+            {SECTION_CACHE_KEY.format(HOMEPAGE_SCHEMA_VERSION, name): section for name, section in built.items()},
+            settings.HOMEPAGE_CACHE_TIMEOUT,
+        )
+
+        snapshot.payload = JSONRenderer().render(
+            {name: data[name] for name in HOMEPAGE_SECTIONS}
+        )
+        snapshot.version += 1
+        snapshot.schema_version = HOMEPAGE_SCHEMA_VERSION
+        snapshot.save()
+    _cache_snapshot(snapshot)
+    homepage_snapshot_rebuilt.send(
+        sender=HomepageSnapshot, snapshot=snapshot,
+        sections=[name for name in HOMEPAGE_SECTIONS if name in names],
+    )
+    return snapshot
+
+
+def rebuild_homepage_snapshot():
+    """Rebuild every section and store the result as the current snapshot."""
+    return rebuild_homepage_sections(HOMEPAGE_SECTIONS)
+
+
+def get_homepage_snapshot():
+    """
+    Return the current snapshot, building it on first use and rebuilding it
+    in full when it predates the current schema version.
+    """
+    snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+    if snapshot is not None and snapshot.schema_version == HOMEPAGE_SCHEMA_VERSION:
+        return snapshot
+    snapshot = HomepageSnapshot.objects.first()
+    if snapshot is None or snapshot.schema_version != HOMEPAGE_SCHEMA_VERSION:
+        return rebuild_homepage_snapshot()
+    return _cache_snapshot(snapshot)
+
+
+def get_encoded_payload(key, payload):
+    """
+    Return the compressed variants of ``payload``, cached under ``key``.
+    ``key`` must change whenever the payload does (it includes the version).
+    """
+    variants = cache.get(ENCODED_CACHE_KEY.format(key))
+    if variants is None:
+        variants = compress_payload(payload)
+        cache.set(ENCODED_CACHE_KEY.format(key), variants, settings.HOMEPAGE_CACHE_TIMEOUT)
+    return variants
+
+
+def get_encoded_snapshot(snapshot):
+    """Return the compressed variants of a draft or published snapshot's payload."""
+    return get_encoded_payload(snapshot.cache_key, snapshot.payload)
+
+
+def get_snapshot_subset(snapshot, names):
+    """
+    Return ``(payload, variants)`` holding only the named sections of a draft
+    or published snapshot, where ``variants`` are the compressed encodings.
+    Cached per snapshot version and section set; no queries are run.
+    """
+    subset_key = f"{snapshot.cache_key}:{','.join(names)}"
+    key = SUBSET_CACHE_KEY.format(subset_key)
+    payload = cache.get(key)
+    if payload is None:
+        data = json.loads(snapshot.payload)
+        payload = JSONRenderer().render({name: data[name] for name in names if name in data})
+        cache.set(key, payload, settings.HOMEPAGE_CACHE_TIMEOUT)
+    return payload, get_encoded_payload(subset_key, payload)
+
+
+def _rebuild_pending():
+    sections = getattr(_pending, 'sections', None)
+    if sections:
+        _pending.sections = set()
+        rebuild_homepage_sections(sections)
+
+
+def schedule_homepage_rebuild(sections):
+    """
+    Rebuild ``sections`` once the current transaction commits.
+    Any number of writes inside one transaction trigger a single rebuild.
+    """
+    if not hasattr(_pending, 'sections'):
+        _pending.sections = set()
+    _pending.sections.update(sections)
+    transaction.on_commit(_rebuild_pending)
@@ -0,0 +1,260 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from .homepage import (
+    HOMEPAGE_QUERY_BUDGET, HOMEPAGE_SECTIONS, SECTION_QUERY_BUDGET, build_homepage_data,
+    build_section,
+)
+from .models import (
+    FAQ, ImagePlaceholder, MediaAsset, ProcessSection, ProcessStep, PublishedSnapshot, Service, Stat,
+    Testimonial,
+)
+from .images import url_content_hash
+from .placeholders import referenced_image_urls
+from .publishing import publish_homepage
+from .search import search
+
+
+class HomepageQueryBudgetTests(TestCase):
+    """Building the homepage must run a fixed number of queries, however much content there is."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_homepage', stdout=StringIO())
+        # More rows than the seed so a per-row query would show up
+        Stat.objects.bulk_create(
+            Stat(label=f'Stat {i}', value=str(i), sort_order=10 + i) for i in range(5)
+        )
+        Service.objects.bulk_create(
+            Service(label=f'0{i}', title=f'Service {i}', description='', outcome='', sort_order=10 + i)
+            for i in range(5)
+        )
+        # Placeholders for every image, so the sections look them up
+        ImagePlaceholder.objects.bulk_create(
+            ImagePlaceholder(url=url, width=1600, height=900, lqip='data:image/jpeg;base64,')
+            for url in referenced_image_urls()
+        )
+
+    def test_every_section_has_a_budget(self):
+        self.assertEqual(set(SECTION_QUERY_BUDGET), set(HOMEPAGE_SECTIONS))
+
+    def test_sections_within_budget(self):
+        for name in HOMEPAGE_SECTIONS:
+            with self.subTest(section=name), self.assertNumQueries(SECTION_QUERY_BUDGET[name]):
+                build_section(name)
+
+    def test_homepage_within_budget(self):
+        with self.assertNumQueries(HOMEPAGE_QUERY_BUDGET):
+            data = build_homepage_data()
+        self.assertGreater(len(data['stats']), 5)
+        self.assertIsNotNone(data['hero']['background_image_placeholder'])
+        self.assertIsNotNone(data['image_gallery'][0]['placeholder'])
+
+    def test_full_build_matches_sections_built_alone(self):
+        self.assertEqual(build_homepage_data(), {name: build_section(name) for name in HOMEPAGE_SECTIONS})
+
+
+class PublishedHomepageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_nothing_published_is_not_found(self):
+        self.assertEqual(self.client.get('/api/homepage/').status_code, 404)
+        self.assertEqual(self.client.get('/api/homepage/changes/').status_code, 404)
+        self.assertFalse(PublishedSnapshot.objects.exists())
+
+    def test_published_version_is_served(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            snapshot = publish_homepage()
+        response = self.client.get('/api/homepage/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], f'W/"homepage-{snapshot.version}"')
+
+
+class BulkOperationsTests(TestCase):
+    url = '/api/stats/bulk/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('editor')
+        cls.first = Stat.objects.create(label='First', value='1', sort_order=1)
+        cls.second = Stat.objects.create(label='Second', value='2', sort_order=2)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def bulk(self, operations):
+        return self.client.post(self.url, operations, content_type='application/json')
+
+    def assertUnchanged(self):
+        self.assertEqual(
+            list(Stat.objects.order_by('pk').values_list('label', 'value')),
+            [('First', '1'), ('Second', '2')],
+        )
+
+    def test_applies_every_operation(self):
+        response = self.bulk([
+            {'op': 'create', 'data': {'label': 'Third', 'value': '3'}},
+            {'op': 'update', 'id': self.first.pk, 'data': {'value': '10'}},
+            {'op': 'delete', 'id': self.second.pk},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.json()['results']], ['created', 'updated', 'deleted'],
+        )
+        self.assertEqual(
+            list(Stat.objects.order_by('pk').values_list('label', 'value')), [('First', '10'), ('Third', '3')],
+        )
+
+    def test_one_invalid_operation_writes_nothing(self):
+        response = self.bulk([
+            {'op': 'create', 'data': {'label': 'Third', 'value': '3'}},
+            {'op': 'update', 'id': self.first.pk, 'data': {'value': 'x' * 100}},
+            {'op': 'delete', 'id': self.second.pk},
+        ])
+        self.assertEqual(response.status_code, 400)
+        results = response.json()['results']
+        self.assertEqual(['errors' in result for result in results], [False, True, False])
+        self.assertUnchanged()
+
+    def test_one_operation_per_id(self):
+        response = self.bulk([
+            {'op': 'update', 'id': self.first.pk, 'data': {'value': '10'}},
+            {'op': 'delete', 'id': self.first.pk},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['results'][1]['errors'], ['Only one operation per id'])
+        self.assertUnchanged()
+
+    def test_malformed_operations_are_rejected(self):
+        for operations in (
+            [{'op': 'update', 'id': [1], 'data': {}}],
+            [{'op': 'delete', 'id': {'pk': 1}}],
+            [{'op': 'delete', 'id': True}],
+            [{'op': 'delete', 'id': 999999}],
+            [{'op': 'upsert'}],
+            ['delete'],
+            {'op': 'delete', 'id': 1},
+            [],
+        ):
+            with self.subTest(operations=operations):
+                self.assertEqual(self.bulk(operations).status_code, 400)
+        self.assertUnchanged()
+
+
+class ReorderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('editor')
+        cls.stats = [Stat.objects.create(label=f'Stat {i}', value=str(i), sort_order=i) for i in range(3)]
+        sections = [ProcessSection.objects.create(title=f'Process {i}') for i in range(2)]
+        cls.steps = [
+            [
+                ProcessStep.objects.create(process_section=section, number=str(i), title='', description='', sort_order=i)
+                for i in range(2)
+            ]
+            for section in sections
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def reorder(self, collection, ids):
+        return self.client.post(f'/api/reorder/{collection}/', {'ids': ids}, content_type='application/json')
+
+    def stat_order(self):
+        return list(Stat.objects.order_by('sort_order').values_list('pk', flat=True))
+
+    def test_reorders_the_collection(self):
+        ids = [self.stats[2].pk, self.stats[0].pk, self.stats[1].pk]
+        self.assertEqual(self.reorder('stats', ids).status_code, 200)
+        self.assertEqual(self.stat_order(), ids)
+
+    def test_rejects_incomplete_duplicated_or_foreign_ids(self):
+        order = self.stat_order()
+        first, second, third = order
+        for ids in (
+            [first, second],
+            [first, second, third, third],
+            [first, first, second],
+            [first, second, third, 999999],
+            [first, second, 'x'],
+            [],
+        ):
+            with self.subTest(ids=ids):
+                self.assertEqual(self.reorder('stats', ids).status_code, 400)
+        self.assertEqual(self.stat_order(), order)
+
+    def test_scoped_collection_is_one_parent(self):
+        (a0, a1), (b0, b1) = [[step.pk for step in steps] for steps in self.steps]
+        self.assertEqual(self.reorder('process-steps', [a1, a0]).status_code, 200)
+        self.assertEqual(self.reorder('process-steps', [a0, b0]).status_code, 400)
+        self.assertEqual(self.reorder('process-steps', [b0, b1, a0]).status_code, 400)
+        self.assertEqual(
+            list(ProcessStep.objects.filter(pk__in=[a0, a1]).order_by('sort_order').values_list('pk', flat=True)),
+            [a1, a0],
+        )
+
+    def test_unknown_collection(self):
+        self.assertEqual(self.reorder('nope', [1]).status_code, 404)
+
+
+class SearchTests(TestCase):
+    def test_highlights_are_escaped(self):
+        FAQ.objects.create(
+            question='Do you <script>alert(1)</script> audit?',
+            answer='Yes & no: <b>valuation</b> audits \ue000 happen yearly.',
+        )
+        [hit] = search('audit')
+        self.assertEqual(hit['title'], 'Do you &lt;script&gt;alert(1)&lt;/script&gt; <mark>audit</mark>?')
+        self.assertEqual(hit['snippet'], 'Yes &amp; no: &lt;b&gt;valuation&lt;/b&gt; <mark>audits</mark>  happen yearly.')
+
+
+class RemoteMediaDeduplicationTests(TestCase):
+    """Remote images are not downloaded, so the same normalized URL is the same image."""
+
+    url = 'https://images.unsplash.com/photo-1?w=600&h=400'
+    # The same image: other scheme, host case, query order and a fragment
+    same_url = 'http://Images.Unsplash.com/photo-1?h=400&w=600#top'
+
+    def test_create_returns_the_existing_asset(self):
+        self.client.force_login(get_user_model().objects.create_user('editor'))
+        first = self.client.post('/api/media-assets/', {'public_id': 'a', 'url': self.url})
+        self.assertEqual(first.status_code, 201)
+        second = self.client.post('/api/media-assets/', {'public_id': 'b', 'url': self.same_url})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()['public_id'], 'a')
+        self.assertEqual(MediaAsset.objects.count(), 1)
+
+    def test_import_skips_a_repeated_url(self):
+        MediaAsset.objects.create(public_id='a', url=self.url)
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl') as manifest:
+            for row in ({'public_id': 'b', 'url': self.same_url}, {'public_id': 'c', 'url': self.url + '&q=80'}):
+                manifest.write(json.dumps(row) + '\n')
+            manifest.flush()
+            call_command('import_media', manifest.name, stdout=StringIO())
+        self.assertEqual(sorted(MediaAsset.objects.values_list('public_id', flat=True)), ['a', 'c'])
+
+    def test_merge_groups_assets_stored_without_a_hash(self):
+        # bulk_create skips save(), as rows written before hashing existed
+        MediaAsset.objects.bulk_create([
+            MediaAsset(public_id='a', url=self.url), MediaAsset(public_id='b', url=self.same_url),
+        ])
+        testimonial = Testimonial.objects.create(name='Client', content='', image_url=self.same_url)
+        call_command('merge_duplicate_media', stdout=StringIO())
+        self.assertEqual(list(MediaAsset.objects.values_list('public_id', flat=True)), ['a'])
+        testimonial.refresh_from_db()
+        self.assertEqual(testimonial.image_url, self.url)
+
+    def test_changing_the_url_rehashes(self):
+        MediaAsset.objects.create(public_id='a', url=self.url)
+        asset = MediaAsset.objects.get(public_id='a')
+        asset.url = 'https://images.unsplash.com/photo-2'
+        asset.save()
+        self.assertEqual(asset.content_hash, url_content_hash(asset.url))
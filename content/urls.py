@@ -17,6 +17,16 @@ router.register(r'media-assets', views.MediaAssetViewSet, basename='mediaasset')
 
 urlpatterns = [
     path('homepage/', views.homepage_data, name='homepage-data'),
+    path('homepage/async/', views.homepage_data_async, name='homepage-data-async'),
+    path('homepage/changes/', views.homepage_changes, name='homepage-changes'),
+    path('homepage/events/', views.homepage_events, name='homepage-events'),
+    path('homepage/draft/', views.homepage_draft, name='homepage-draft'),
+    path('homepage/versions/', views.homepage_versions, name='homepage-versions'),
+    path('homepage/publish/', views.homepage_publish, name='homepage-publish'),
+    path('homepage/versions/<int:version>/rollback/', views.homepage_rollback, name='homepage-rollback'),
+    path('images/<path:path>', views.resized_image, name='content-resized-image'),
+    path('search/', views.content_search, name='content-search'),
+    path('reorder/<str:collection>/', views.content_reorder, name='content-reorder'),
     path('', include(router.urls)),
 ]
 
@@ -1,223 +1,583 @@
-from rest_framework import viewsets, status
-from rest_framework.decorators import api_view, permission_classes
+import asyncio
+import json
+from rest_framework import exceptions, viewsets, status
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import condition, require_GET
 from .models import (
-    Hero, Stat, BrutalMathSection, BrutalMathStat, WhyCentauraSection,
-    WhyCentauraFeature, Service, ComparisonTable, ComparisonTableFeature,
-    PortfolioProject, PeopleBehindStrategy, WhyWeBuiltSection, ProcessSection,
-    ProcessStep, FinalWordSection, Footer, SocialLink, MediaAsset, SEO, Navigation, FAQ, Testimonial
+    Hero, Stat, Service, PortfolioProject, Footer, SocialLink, MediaAsset,
+    SEO, Navigation, FAQ, Testimonial, HomepageSnapshot, PublishedSnapshot
 )
 from .serializers import (
     HeroSerializer, StatSerializer, ServiceSerializer, PortfolioProjectSerializer,
     TestimonialSerializer, FAQSerializer, SEOSerializer, NavigationSerializer,
-    FooterSerializer, SocialLinkSerializer, MediaAssetSerializer
+    FooterSerializer, SocialLinkSerializer, MediaAssetSerializer,
+    sparse_fieldset,
 )
+from . import notifier
+from .homepage import HOMEPAGE_SECTIONS, sections_for_model
+from .compression import encoded_json_response
+from .images import content_hash, media_path
+from .media import find_duplicate, media_typeahead
+from .pagination import KeysetPagination
+from .resize import FORMATS, ResizeError, encode_variant, variant_cache, variant_key
+from .reorder import REORDERABLE_COLLECTIONS, ReorderError, reorder_collection
+from .search import SEARCH_MODELS, index_objects, search, search_available
+from .row_serializers import row_serializer_for, serializer_field_names
+from .publishing import (
+    get_homepage_changes, get_published_snapshot, publish_homepage, rollback_homepage
+)
+from .snapshot import (
+    aget_homepage_sections, get_encoded_snapshot, get_homepage_snapshot, get_snapshot_subset,
+    schedule_homepage_rebuild,
+)
+
 
+NOTHING_PUBLISHED = 'The homepage has not been published yet'
 
+
+def requested_sections(request):
+    """
+    Parse ``?sections=hero,stats`` into section names in payload order,
+    followed by any unknown names. Returns None when the parameter is absent.
+    """
+    param = request.GET.get('sections')
+    if not param:
+        return None
+    names = {name.strip() for name in param.split(',') if name.strip()}
+    known = [name for name in HOMEPAGE_SECTIONS if name in names]
+    return known + sorted(names.difference(known))
+
+
+def unknown_sections(request):
+    """Return the requested section names that are not homepage sections."""
+    return [name for name in requested_sections(request) or () if name not in HOMEPAGE_SECTIONS]
+
+
+def snapshot_etag(request, snapshot, prefix):
+    # No validator for requests answered with 400, so they are never 304
+    if unknown_sections(request):
+        return None
+    sections = requested_sections(request)
+    if sections:
+        return 'W/"%s-%s-%s"' % (prefix, snapshot.version, '-'.join(sections))
+    # Weak: the same version is served in several content encodings
+    return f'W/"{prefix}-{snapshot.version}"'
+
+
+def snapshot_response(request, snapshot):
+    """Serve a draft or published snapshot, honouring ``?sections=``."""
+    sections = requested_sections(request)
+    if sections:
+        unknown = unknown_sections(request)
+        if unknown:
+            return Response(
+                {'error': f"Unknown sections: {', '.join(unknown)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        payload, variants = get_snapshot_subset(snapshot, sections)
+        return encoded_json_response(request, payload, variants)
+    return encoded_json_response(request, snapshot.payload, get_encoded_snapshot(snapshot))
+
+
+def homepage_etag(request):
+    snapshot = get_published_snapshot()
+    return snapshot_etag(request, snapshot, 'homepage') if snapshot else None
+
+
+def homepage_last_modified(request):
+    snapshot = get_published_snapshot()
+    if snapshot is None or unknown_sections(request):
+        return None
+    return snapshot.created_at
+
+
+@condition(etag_func=homepage_etag, last_modified_func=homepage_last_modified)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def homepage_data(request):
     """
     Aggregated endpoint that returns all homepage content in a single response.
-    This matches the structure of the content seed JSON for easy React consumption.
+    Serves the latest published snapshot's bytes, so no content queries run
+    per request and unpublished dashboard edits never reach the public site.
+    Revalidations (If-None-Match / If-Modified-Since) are answered with 304.
+    Pass ``?sections=hero,stats`` to receive only those sections.
+    Bodies are served pre-compressed (br/gzip) according to Accept-Encoding.
+    404 until the first version is published.
     """
-    # Hero
-    hero = Hero.objects.first()
-    hero_data = {
-        'title': hero.title if hero else '',
-        'subtitle': hero.subtitle if hero else '',
-        'cta_text': hero.cta_text if hero else '',
-        'cta_url': hero.cta_link if hero else '#',
-        'background_image_url': hero.background_image if hero else '',
-        'quote': hero.quote if hero else '',
-        'founders': {
-            'names': hero.founders_names if hero else '',
-            'title': hero.founders_title if hero else '',
-            'images': hero.founders_images if hero else [],
-        }
-    } if hero else {}
-
-    # Stats
-    stats = Stat.objects.all().order_by('sort_order')
-    stats_data = [
-        {'label': stat.label, 'value': stat.value}
-        for stat in stats
-    ]
-
-    # Brutal Math
-    brutal_math_section = BrutalMathSection.objects.first()
-    brutal_math_stats = BrutalMathStat.objects.all().order_by('sort_order')
-    brutal_math_data = {
-        'title': brutal_math_section.title if brutal_math_section else '',
-        'subtitle': brutal_math_section.subtitle if brutal_math_section else '',
-        'statistics': [
-            {'value': stat.value, 'description': stat.description}
-            for stat in brutal_math_stats
-        ],
-        'closing_text': brutal_math_section.closing_text if brutal_math_section else '',
-    } if brutal_math_section else {}
-
-    # Why Centaura
-    why_centaura_section = WhyCentauraSection.objects.first()
-    why_centaura_features = WhyCentauraFeature.objects.all().order_by('sort_order')
-    why_centaura_data = {
-        'label': why_centaura_section.label if why_centaura_section else '',
-        'title': why_centaura_section.title if why_centaura_section else '',
-        'image_url': why_centaura_section.image_url if why_centaura_section else '',
-        'features': [
-            {'title': feature.title, 'description': feature.description}
-            for feature in why_centaura_features
-        ],
-        'cta_text': why_centaura_section.cta_text if why_centaura_section else '',
-        'cta_url': why_centaura_section.cta_url if why_centaura_section else '#',
-    } if why_centaura_section else {}
-
-    # Services
-    services = Service.objects.all().order_by('sort_order')
-    services_data = [
-        {
-            'label': service.label,
-            'title': service.title,
-            'description': service.description,
-            'outcome': service.outcome,
-        }
-        for service in services
-    ]
-
-    # Comparison Table
-    comparison_table = ComparisonTable.objects.first()
-    comparison_features = ComparisonTableFeature.objects.filter(
-        comparison_table=comparison_table
-    ).order_by('sort_order') if comparison_table else []
-    comparison_data = {
-        'title': comparison_table.title if comparison_table else '',
-        'subtitle': comparison_table.subtitle if comparison_table else '',
-        'features': [
-            {
-                'name': feature.name,
-                'typical': feature.typical,
-                'centaura': feature.centaura,
-            }
-            for feature in comparison_features
-        ],
-        'cta_text': comparison_table.cta_text if comparison_table else '',
-        'cta_url': comparison_table.cta_url if comparison_table else '#',
-    } if comparison_table else {}
-
-    # Case Studies (Portfolio Projects)
-    case_studies = PortfolioProject.objects.filter(is_active=True).order_by('sort_order')
-    case_studies_data = [
+    snapshot = get_published_snapshot()
+    if snapshot is None:
+        return Response({'error': NOTHING_PUBLISHED}, status=status.HTTP_404_NOT_FOUND)
+    return snapshot_response(request, snapshot)
+
+
+def draft_etag(request):
+    return snapshot_etag(request, get_homepage_snapshot(), 'draft')
+
+
+def draft_last_modified(request):
+    if unknown_sections(request):
+        return None
+    return get_homepage_snapshot().updated_at
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@condition(etag_func=draft_etag, last_modified_func=draft_last_modified)
+def homepage_draft(request):
+    """Preview of the unpublished homepage, in the same format as homepage_data"""
+    return snapshot_response(request, get_homepage_snapshot())
+
+
+def api_user(request):
+    """
+    Authenticate a plain Django request with the REST framework's configured
+    authentication classes (session, bearer token or API key).
+    Raises AuthenticationFailed for invalid credentials.
+    """
+    authenticators = [auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    return Request(request, authenticators=authenticators).user
+
+
+@require_GET
+async def homepage_data_async(request):
+    """
+    Async draft preview for ASGI deployments (config/asgi.py).
+    Sections missing from the cache are loaded concurrently instead of one
+    after another. Accepts the same ``?sections=`` parameter. It reads the
+    live content tables, so it is limited to authenticated editors and
+    machine clients, authenticated the same way as the rest of the API.
+    """
+    try:
+        user = await sync_to_async(api_user)(request)
+    except exceptions.AuthenticationFailed as exc:
+        return JsonResponse({'detail': str(exc.detail)}, status=exc.status_code)
+    if not user.is_authenticated:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=403)
+
+    sections = requested_sections(request) or list(HOMEPAGE_SECTIONS)
+    unknown = [name for name in sections if name not in HOMEPAGE_SECTIONS]
+    if unknown:
+        return JsonResponse({'error': f"Unknown sections: {', '.join(unknown)}"}, status=400)
+
+    data = await aget_homepage_sections(sections)
+    return HttpResponse(JSONRenderer().render(data), content_type='application/json')
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def homepage_changes(request):
+    """
+    Delta sync: ``?since=<version>`` returns only the sections published
+    after that version, or a full snapshot when the client is too far behind.
+    """
+    since = request.GET.get('since')
+    if since is not None:
+        try:
+            since = int(since)
+            if since < 0:
+                raise ValueError(since)
+        except ValueError:
+            return Response({'error': 'since must be a non-negative integer version'}, status=status.HTTP_400_BAD_REQUEST)
+    changes = get_homepage_changes(since)
+    if changes is None:
+        return Response({'error': NOTHING_PUBLISHED}, status=status.HTTP_404_NOT_FOUND)
+    payload, variants = changes
+    return encoded_json_response(request, payload, variants)
+
+
+def _stream_versions():
+    """Return ``(draft_version, published_version, published_section_versions)``."""
+    draft = HomepageSnapshot.objects.values_list('version', flat=True).first() or 0
+    published = PublishedSnapshot.objects.values_list('version', 'section_versions').first()
+    return (draft, *published) if published else (draft, 0, {})
+
+
+def _missed_events(seen, channels):
+    """Events on ``channels`` for versions in the database newer than ``seen``, e.g. from other workers."""
+    draft, published, section_versions = _stream_versions()
+    events = []
+    if 'draft' in channels and draft > seen['draft']:
+        # The draft doesn't record per-section versions; None means "refetch all"
+        events.append({'channel': 'draft', 'version': draft, 'sections': None})
+    if published > seen['published']:
+        events.append({
+            'channel': 'published',
+            'version': published,
+            'sections': [name for name, version in section_versions.items() if version > seen['published']],
+        })
+    return events
+
+
+@require_GET
+async def homepage_events(request):
+    """
+    Server-Sent Events feed of homepage changes, so clients can stop polling.
+
+    Sends a ``draft`` event whenever saved content rebuilds the draft snapshot
+    and a ``published`` event for every new published version. Draft events
+    reveal unpublished edits, so only authenticated clients receive them;
+    anonymous clients get ``published`` events only. Each carries
+    the new ``version`` and the names of the changed ``sections``. Events from
+    this process arrive immediately; changes made in other workers are picked
+    up by polling the snapshot versions every HOMEPAGE_EVENTS_POLL_INTERVAL
+    seconds. Event ids are ``<draft version>-<published version>``, so a
+    reconnecting client (Last-Event-ID) is caught up on what it missed.
+    Needs an ASGI server to hold connections open.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({'error': 'The event stream requires an ASGI server (see config/asgi.py).'}, status=501)
+
+    try:
+        user = await sync_to_async(api_user)(request)
+    except exceptions.AuthenticationFailed as exc:
+        return JsonResponse({'detail': str(exc.detail)}, status=exc.status_code)
+    channels = {'draft', 'published'} if user.is_authenticated else {'published'}
+
+    try:
+        resume_draft, resume_published = map(int, request.headers['Last-Event-ID'].split('-'))
+    except (KeyError, ValueError):
+        resume_draft = resume_published = None
+
+    async def stream():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        notifier.subscribe(loop, queue)
+        try:
+            if resume_draft is None:
+                draft, published, _ = await sync_to_async(_stream_versions)()
+                seen = {'draft': draft, 'published': published}
+                events = []
+            else:
+                seen = {'draft': resume_draft, 'published': resume_published}
+                events = await sync_to_async(_missed_events)(seen, channels)
+            if 'draft' not in channels:
+                # Event ids must not leak the draft version either
+                seen['draft'] = 0
+            yield f'retry: {settings.HOMEPAGE_EVENTS_RETRY_MS}\n\n'
+
+            while True:
+                for event in events:
+                    if event['channel'] not in channels or event['version'] <= seen[event['channel']]:
+                        continue
+                    seen[event['channel']] = event['version']
+                    data = json.dumps({'version': event['version'], 'sections': event['sections']})
+                    yield f"id: {seen['draft']}-{seen['published']}\nevent: {event['channel']}\ndata: {data}\n\n"
+                try:
+                    events = [await asyncio.wait_for(
+                        queue.get(), timeout=settings.HOMEPAGE_EVENTS_POLL_INTERVAL,
+                    )]
+                except asyncio.TimeoutError:
+                    events = await sync_to_async(_missed_events)(seen, channels)
+                    if not events:
+                        yield ': keepalive\n\n'
+        finally:
+            notifier.unsubscribe(loop, queue)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def homepage_versions(request):
+    """List published homepage versions, newest first"""
+    versions = PublishedSnapshot.objects.values(
+        'version', 'rolled_back_from', 'created_at', 'published_by__username',
+    )[:50]
+    return Response([
         {
-            'category': project.category,
-            'title': project.title,
-            'description': project.description,
-            'image_url': project.image_url,
+            'version': version['version'],
+            'rolled_back_from': version['rolled_back_from'],
+            'published_at': version['created_at'],
+            'published_by': version['published_by__username'],
         }
-        for project in case_studies
-    ]
-
-    # People Behind Strategy
-    people = PeopleBehindStrategy.objects.first()
-    people_data = {
-        'title': people.title if people else '',
-        'intro': people.intro if people else '',
-        'jane': {
-            'name': people.jane_name if people else '',
-            'title': people.jane_title if people else '',
-            'image_url': people.jane_image_url if people else '',
-            'bio': people.jane_bio if people else [],
-        },
-        'aimun': {
-            'name': people.aimun_name if people else '',
-            'title': people.aimun_title if people else '',
-            'image_url': people.aimun_image_url if people else '',
-            'bio': people.aimun_bio if people else [],
-        },
-        'cta_text': people.cta_text if people else '',
-        'cta_url': people.cta_url if people else '#',
-    } if people else {}
-
-    # Why We Built
-    why_built = WhyWeBuiltSection.objects.first()
-    why_built_data = {
-        'left': {
-            'title': why_built.left_title if why_built else '',
-            'content': why_built.left_content if why_built else [],
-        },
-        'right': {
-            'title': why_built.right_title if why_built else '',
-            'content': why_built.right_content if why_built else [],
-        },
-    } if why_built else {}
-
-    # Process
-    process_section = ProcessSection.objects.first()
-    process_steps = ProcessStep.objects.filter(
-        process_section=process_section
-    ).order_by('sort_order') if process_section else []
-    process_data = {
-        'label': process_section.label if process_section else '',
-        'title': process_section.title if process_section else '',
-        'steps': [
-            {
-                'number': step.number,
-                'title': step.title,
-                'description': step.description,
-            }
-            for step in process_steps
-        ],
-        'cta_text': process_section.cta_text if process_section else '',
-        'cta_url': process_section.cta_url if process_section else '#',
-    } if process_section else {}
-
-    # Final Word
-    final_word = FinalWordSection.objects.first()
-    final_word_data = {
-        'label': final_word.label if final_word else '',
-        'title': final_word.title if final_word else '',
-        'content': final_word.content if final_word else [],
-        'background_image': final_word.background_image if final_word else '',
-        'cta_text': final_word.cta_text if final_word else '',
-        'cta_url': final_word.cta_url if final_word else '#',
-    } if final_word else {}
-
-    # Footer
-    footer = Footer.objects.first()
-    footer_data = footer.content if footer else {}
-    if footer:
-        footer_data['copyright'] = footer.copyright_text
-
-    # Image Gallery
-    gallery_images = MediaAsset.objects.filter(folder='gallery').order_by('-created_at')[:4]
-    image_gallery_data = [
-        {
-            'url': asset.url,
-            'alt': asset.public_id,
+        for version in versions
+    ])
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def homepage_publish(request):
+    """Publish the current draft as a new version"""
+    snapshot = publish_homepage(user=request.user)
+    return Response({'version': snapshot.version}, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def homepage_rollback(request, version):
+    """Publish an earlier version again"""
+    source = get_object_or_404(PublishedSnapshot, pk=version)
+    snapshot = rollback_homepage(source.version, user=request.user)
+    return Response({'version': snapshot.version}, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def content_reorder(request, collection):
+    """
+    Reorder a ``sort_order`` collection in one statement.
+    Body: ``{"ids": [3, 1, 2]}`` listing every item in its new order.
+    """
+    if collection not in REORDERABLE_COLLECTIONS:
+        return Response({'error': f'Unknown collection: {collection}'}, status=status.HTTP_404_NOT_FOUND)
+    ids = request.data.get('ids') if isinstance(request.data, dict) else None
+    if not isinstance(ids, list) or not all(isinstance(pk, int) for pk in ids):
+        return Response({'error': 'ids must be a list of integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        reorder_collection(collection, ids)
+    except ReorderError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'collection': collection, 'ids': ids})
+
+
+@api_view(['GET'])
+def content_search(request):
+    """
+    Full-text search across FAQs, testimonials, services, portfolio projects
+    and the people bios. ``?q=`` is required; ``?limit=`` defaults to 20.
+    """
+    if not search_available():
+        return Response({'error': 'Search requires the SQLite database'}, status=status.HTTP_501_NOT_IMPLEMENTED)
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        limit = min(max(int(request.query_params.get('limit', 20)), 1), 50)
+    except ValueError:
+        return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'query': query, 'results': search(query, limit)})
+
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@require_GET
+def resized_image(request, path):
+    """
+    ``/api/images/<path under MEDIA_ROOT>?w=<width>&format=<webp|jpeg|png>``
+
+    A locally stored image scaled to one of MEDIA_VARIANT_WIDTHS. Without
+    ``format`` the response is WebP for clients that accept it and the
+    source's own kind otherwise.
+    """
+    try:
+        width = int(request.GET.get('w', ''))
+    except ValueError:
+        width = None
+    if width not in settings.MEDIA_VARIANT_WIDTHS:
+        widths = ', '.join(map(str, settings.MEDIA_VARIANT_WIDTHS))
+        return JsonResponse({'error': f'w must be one of {widths}'}, status=400)
+
+    image_format = request.GET.get('format')
+    negotiated = image_format is None
+    if negotiated:
+        if 'image/webp' in request.headers.get('Accept', ''):
+            image_format = 'webp'
+        else:
+            image_format = 'png' if path.lower().endswith('.png') else 'jpeg'
+    elif image_format not in FORMATS:
+        return JsonResponse({'error': f'format must be one of {", ".join(FORMATS)}'}, status=400)
+
+    source = media_path(path)
+    if source is None:
+        return JsonResponse({'error': 'Not found'}, status=404)
+
+    key = variant_key(source, width, image_format)
+    etag = f'"{key}"'
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        try:
+            data = variant_cache.get_or_create(key, image_format, lambda: encode_variant(source, width, image_format))
+        except ResizeError as exc:
+            return JsonResponse({'error': str(exc)}, status=415)
+        response = HttpResponse(data, content_type=FORMATS[image_format][1])
+    response['ETag'] = etag
+    response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    if negotiated:
+        patch_vary_headers(response, ['Accept'])
+    return response
+
+
+class SparseFieldsetMixin:
+    """
+    Load only the columns a ``?fields=`` / ``?omit=`` request renders, plus
+    the primary key and any pagination key, so unrequested columns are
+    neither read nor decoded.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        selected = sparse_fieldset(self.request, list(self.get_serializer_class()().fields))
+        if selected is None:
+            return queryset
+        concrete = {field.name for field in queryset.model._meta.concrete_fields}
+        keys = [field.lstrip('-') for field in getattr(self, 'ordering', None) or ()]
+        return queryset.only(*concrete.intersection([*selected, *keys]), queryset.model._meta.pk.name)
+
+
+class RowListMixin:
+    """
+    Serve ``list`` from ``values_list()`` tuples through a RowSerializer
+    compiled once per serializer and field selection, instead of building a
+    model instance and running every ModelSerializer field for each row.
+    Output is identical to the regular list; ``manage.py
+    benchmark_list_serialization`` compares the two.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        available = serializer_field_names(serializer_class)
+        names = tuple(sparse_fieldset(request, list(available)) or available)
+        row_serializer = row_serializer_for(serializer_class, names)
+        if row_serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        keys = [field.lstrip('-') for field in getattr(self, 'ordering', None) or ()]
+        rows = self.filter_queryset(self.get_queryset()).values_list(
+            *row_serializer.columns,
+            *[key for key in keys if key not in row_serializer.columns],
+            named=self.paginator is not None,
+        )
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(row_serializer.serialize(page))
+        return Response(row_serializer.serialize(rows))
+
+
+def _is_id(value):
+    # bool is an int subclass, but true is not a primary key
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class BulkOperationsMixin:
+    """
+    ``POST <list url>/bulk/`` with a list of operations::
+
+        [{"op": "create", "data": {...}},
+         {"op": "update", "id": 3, "data": {...}},
+         {"op": "delete", "id": 7}]
+
+    Every item is validated first; if any fails nothing is written and the
+    response is 400. Otherwise all of them are applied in one transaction
+    with one bulk_create, one bulk_update and one delete, and the homepage
+    sections that read the model are rebuilt once on commit. The response
+    lists one result per operation, in request order.
+    """
+    bulk_max_operations = 500
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        operations = request.data
+        if not isinstance(operations, list) or not operations:
+            return Response({'error': 'Expected a non-empty list of operations'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(operations) > self.bulk_max_operations:
+            return Response(
+                {'error': f'At most {self.bulk_max_operations} operations per request'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        model = self.get_serializer_class().Meta.model
+        # Only well-formed ids reach the set: a list or dict id is unhashable
+        ids = {
+            op['id'] for op in operations
+            if isinstance(op, dict) and op.get('op') in ('update', 'delete') and _is_id(op.get('id'))
         }
-        for asset in gallery_images
-    ]
-
-    return Response({
-        'hero': hero_data,
-        'stats': stats_data,
-        'brutal_math': brutal_math_data,
-        'why_centaura': why_centaura_data,
-        'services': services_data,
-        'comparison_table': comparison_data,
-        'case_studies': case_studies_data,
-        'people_behind_strategy': people_data,
-        'why_we_built': why_built_data,
-        'process': process_data,
-        'final_word': final_word_data,
-        'footer': footer_data,
-        'image_gallery': image_gallery_data,
-    })
+        existing = model.objects.in_bulk(ids)
+
+        results, to_create, to_update, to_delete = [], [], [], []
+        seen = set()
+        for operation in operations:
+            result, serializer = self._validate_operation(operation, existing)
+            results.append(result)
+            if 'id' in result and 'errors' not in result:
+                if result['id'] in seen:
+                    result['errors'] = ['Only one operation per id']
+                seen.add(result['id'])
+            if 'errors' in result:
+                continue
+            if result['op'] == 'create':
+                to_create.append((result, model(**serializer.validated_data)))
+            elif result['op'] == 'update':
+                to_update.append((result, serializer))
+            else:
+                to_delete.append(result['id'])
+
+        if any('errors' in result for result in results):
+            return Response({'results': results}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            model.objects.bulk_create([instance for _, instance in to_create])
+
+            update_fields = {'updated_at'}
+            now = timezone.now()
+            for _, serializer in to_update:
+                for name, value in serializer.validated_data.items():
+                    setattr(serializer.instance, name, value)
+                    update_fields.add(name)
+                serializer.instance.updated_at = now
+            model.objects.bulk_update([serializer.instance for _, serializer in to_update], update_fields)
+
+            model.objects.filter(pk__in=to_delete).delete()
+            if model in SEARCH_MODELS:
+                # bulk_create/bulk_update send no post_save for the search signal handlers
+                index_objects(model, [
+                    *(instance for _, instance in to_create),
+                    *(serializer.instance for _, serializer in to_update),
+                ])
+            schedule_homepage_rebuild(sections_for_model(model))
+
+        serializer_class = self.get_serializer_class()
+        for result, instance in to_create:
+            result.update(id=instance.pk, status='created', data=serializer_class(instance).data)
+        for result, serializer in to_update:
+            result.update(status='updated', data=serializer_class(serializer.instance).data)
+        for result in results:
+            result.setdefault('status', 'deleted')
+        return Response({'results': results})
+
+    def _validate_operation(self, operation, existing):
+        if not isinstance(operation, dict) or operation.get('op') not in ('create', 'update', 'delete'):
+            return {'op': None, 'errors': ['op must be one of create, update, delete']}, None
+
+        op = operation['op']
+        result = {'op': op}
+        if op == 'create':
+            serializer = self.get_serializer(data=operation.get('data'))
+        else:
+            result['id'] = operation.get('id')
+            instance = existing.get(result['id']) if _is_id(result['id']) else None
+            if instance is None:
+                result['errors'] = ['Not found']
+                return result, None
+            if op == 'delete':
+                return result, None
+            serializer = self.get_serializer(instance, data=operation.get('data'), partial=True)
+
+        if not serializer.is_valid():
+            result['errors'] = serializer.errors
+        return result, serializer
 
 
 # Keep existing ViewSets for individual content management
-class SEOViewSet(viewsets.ModelViewSet):
+class SEOViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = SEO.objects.all()
     serializer_class = SEOSerializer
     permission_classes = [IsAuthenticated]
@@ -236,7 +596,7 @@ class SEOViewSet(viewsets.ModelViewSet):
             serializer.save()
 
 
-class NavigationViewSet(viewsets.ModelViewSet):
+class NavigationViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Navigation.objects.all()
     serializer_class = NavigationSerializer
     permission_classes = [IsAuthenticated]
@@ -253,7 +613,7 @@ class NavigationViewSet(viewsets.ModelViewSet):
             serializer.save()
 
 
-class HeroViewSet(viewsets.ModelViewSet):
+class HeroViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Hero.objects.all()
     serializer_class = HeroSerializer
     permission_classes = [IsAuthenticated]
@@ -270,42 +630,47 @@ class HeroViewSet(viewsets.ModelViewSet):
             serializer.save()
 
 
-class StatViewSet(viewsets.ModelViewSet):
+class StatViewSet(BulkOperationsMixin, RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Stat.objects.all()
     serializer_class = StatSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['sort_order', 'created_at']
+    pagination_class = KeysetPagination
+    ordering = ['sort_order', 'created_at', 'id']
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(BulkOperationsMixin, RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['sort_order', 'created_at']
+    pagination_class = KeysetPagination
+    ordering = ['sort_order', 'created_at', 'id']
 
 
-class PortfolioProjectViewSet(viewsets.ModelViewSet):
+class PortfolioProjectViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = PortfolioProject.objects.all()
     serializer_class = PortfolioProjectSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['sort_order', 'created_at']
+    pagination_class = KeysetPagination
+    ordering = ['sort_order', 'created_at', 'id']
 
 
-class TestimonialViewSet(viewsets.ModelViewSet):
+class TestimonialViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Testimonial.objects.all()
     serializer_class = TestimonialSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['sort_order', 'created_at']
+    pagination_class = KeysetPagination
+    ordering = ['sort_order', 'created_at', 'id']
 
 
-class FAQViewSet(viewsets.ModelViewSet):
+class FAQViewSet(BulkOperationsMixin, RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = FAQ.objects.all()
     serializer_class = FAQSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['sort_order', 'created_at']
+    pagination_class = KeysetPagination
+    ordering = ['sort_order', 'created_at', 'id']
 
 
-class FooterViewSet(viewsets.ModelViewSet):
+class FooterViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Footer.objects.all()
     serializer_class = FooterSerializer
     permission_classes = [IsAuthenticated]
@@ -322,16 +687,54 @@ class FooterViewSet(viewsets.ModelViewSet):
             serializer.save()
 
 
-class SocialLinkViewSet(viewsets.ModelViewSet):
+class SocialLinkViewSet(BulkOperationsMixin, RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = SocialLink.objects.all()
     serializer_class = SocialLinkSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['sort_order', 'created_at']
+    pagination_class = KeysetPagination
+    ordering = ['sort_order', 'created_at', 'id']
 
 
-class MediaAssetViewSet(viewsets.ModelViewSet):
+class MediaAssetViewSet(RowListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = MediaAsset.objects.all()
     serializer_class = MediaAssetSerializer
     permission_classes = [IsAuthenticated]
-    ordering = ['-created_at']
+    pagination_class = KeysetPagination
+    ordering = ['-created_at', 'id']
+
+    def create(self, request, *args, **kwargs):
+        # Adding an image already in the library (same file or same URL) returns the existing asset (200, not 201)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        duplicate = find_duplicate(content_hash(serializer.validated_data.get('url')))
+        if duplicate is not None:
+            return Response(self.get_serializer(duplicate).data)
+        self.perform_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_update(self, serializer):
+        # Pointing an asset at an image another asset already holds would store a second copy
+        if 'url' in serializer.validated_data:
+            duplicate = find_duplicate(
+                content_hash(serializer.validated_data['url']),
+                exclude_public_id=serializer.instance.public_id,
+            )
+            if duplicate is not None:
+                raise exceptions.ValidationError({'url': [f'Same file as media asset "{duplicate.public_id}".']})
+        serializer.save()
+
+    @action(detail=False, methods=['get'])
+    def typeahead(self, request):
+        """
+        ``?q=<public_id prefix>&folder=<folder>&limit=<n>``: the first matches
+        in public_id order, with only their thumbnail.
+        """
+        prefix = request.query_params.get('q', '')
+        if not prefix:
+            return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(media_typeahead(prefix, request.query_params.get('folder'), limit))
 
@@ -23,6 +23,9 @@ urlpatterns = [
     path('faqs/', views.faqs_list, name='faqs_list'),
     path('footer/', views.footer_edit, name='footer_edit'),
     path('final-word/', views.final_word_edit, name='final_word_edit'),
+    path('publish/', views.publish_list, name='publish_list'),
+    path('publish/new/', views.publish, name='publish'),
+    path('publish/<int:version>/rollback/', views.publish_rollback, name='publish_rollback'),
     path('logout/', views.logout_view, name='logout'),
 ]
 
@@ -9,8 +9,14 @@ from django.utils.decorators import method_decorator
 import json
 from content.models import (
     Hero, Stat, Service, PortfolioProject, Testimonial, FAQ,
-    SEO, Navigation, Footer, SocialLink, MediaAsset, FinalWordSection
+    SEO, Navigation, Footer, SocialLink, MediaAsset, FinalWordSection,
+    PublishedSnapshot
 )
+from content.media import media_typeahead
+from content.publishing import publish_homepage, rollback_homepage
+from content.snapshot import get_homepage_snapshot
+
+GALLERY_PAGE_SIZE = 48
 
 
 def normalize_url(value):
@@ -93,9 +99,20 @@ def dashboard_home(request):
 
 @login_required
 def gallery_list(request):
-    """Gallery/Media assets management"""
-    assets = MediaAsset.objects.all().order_by('-created_at')
-    return render(request, 'dashboard/gallery/list.html', {'assets': assets})
+    """Gallery/Media assets management: the latest uploads, or a public_id prefix search"""
+    query = request.GET.get('q', '').strip()
+    folder = request.GET.get('folder', '').strip()
+    fields = ('id', 'public_id', 'thumbnail_url', 'url')
+    if query:
+        assets = media_typeahead(query, folder or None, limit=GALLERY_PAGE_SIZE, fields=fields)
+    else:
+        assets = MediaAsset.objects.order_by('-created_at', 'id')
+        if folder:
+            assets = assets.filter(folder=folder)
+        assets = assets.values(*fields)[:GALLERY_PAGE_SIZE]
+    return render(request, 'dashboard/gallery/list.html', {
+        'assets': assets, 'query': query, 'folder': folder, 'page_size': GALLERY_PAGE_SIZE,
+    })
 
 
 @login_required
@@ -313,6 +330,39 @@ def final_word_edit(request):
     })
 
 
+@login_required
+def publish_list(request):
+    """Publish the draft homepage and manage published versions"""
+    draft = get_homepage_snapshot()
+    versions = PublishedSnapshot.objects.select_related('published_by')[:50]
+    latest = versions[0] if versions else None
+    return render(request, 'dashboard/publish/list.html', {
+        'draft': draft,
+        'versions': versions,
+        'latest': latest,
+        'has_unpublished_changes': latest is None or bytes(latest.payload) != draft.payload,
+    })
+
+
+@login_required
+@require_http_methods(["POST"])
+def publish(request):
+    """Publish the current draft as a new version"""
+    snapshot = publish_homepage(user=request.user)
+    messages.success(request, f'Published version {snapshot.version}.')
+    return redirect('dashboard:publish_list')
+
+
+@login_required
+@require_http_methods(["POST"])
+def publish_rollback(request, version):
+    """Republish an earlier version"""
+    source = get_object_or_404(PublishedSnapshot, pk=version)
+    snapshot = rollback_homepage(source.version, user=request.user)
+    messages.success(request, f'Rolled back to version {source.version} (published as version {snapshot.version}).')
+    return redirect('dashboard:publish_list')
+
+
 @login_required
 def logout_view(request):
     """Logout and redirect to login"""